@@ -1,28 +1,95 @@
+import json
 import logging
+import os
 import platform
 import subprocess
-from typing import Dict
+import time
+from functools import cache
+from pathlib import Path
+from typing import Dict, Optional
 
 import psutil
 
+HARDWARE_CACHE_FILE = Path(__file__).with_name("hardware_cache.json")
+HARDWARE_PROBE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+HARDWARE_TEXT_TEMPLATE = (
+    "🖥️ Железо ПК:\n"
+    "🧠 CPU: {cpu}\n"
+    "🎮 GPU: {gpu}\n"
+    "💾 RAM: {ram}\n"
+    "🪟 Windows: {windows}\n"
+    "🧩 Архитектура: {arch}"
+)
+HARDWARE_UNAVAILABLE_TEXT = "🖥️ Железо ПК:\n(данные недоступны)"
+PCI_DEVICES_DIR = Path("/sys/bus/pci/devices")
+PCI_IDS_PATHS = ("/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids")
+PCI_DISPLAY_CLASS_PREFIX = "0x03"
 HARDWARE_CACHE: Dict[str, str] = {}
-HARDWARE_TEXT = ""
+HARDWARE_TEXT = HARDWARE_UNAVAILABLE_TEXT
 _HARDWARE_INITIALIZED = False
 
 
+@cache
 def _get_cpu_model() -> str:
     try:
-        with open("/proc/cpuinfo", "r", encoding="utf-8", errors="ignore") as fh:
-            for line in fh:
-                if "model name" in line:
-                    return line.split(":", 1)[1].strip()
+        with open("/proc/cpuinfo", "rb") as fh:
+            data = fh.read()
+        start = data.find(b"model name")
+        if start >= 0:
+            end = data.find(b"\n", start)
+            value = data[data.find(b":", start) + 1 : end if end >= 0 else None]
+            return value.strip().decode("utf-8", "ignore")
     except Exception:
         logging.debug("CPU detection via /proc/cpuinfo failed", exc_info=True)
     cpu_name = platform.processor()
     return cpu_name or "Unknown CPU"
 
 
+def _lookup_pci_name(vendor: str, device: str) -> Optional[str]:
+    for path in PCI_IDS_PATHS:
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+                vendor_name = None
+                for line in fh:
+                    if line.startswith("#") or not line.strip():
+                        continue
+                    if vendor_name is None:
+                        if line.startswith(f"{vendor}  "):
+                            vendor_name = line[len(vendor) :].strip()
+                        continue
+                    if not line.startswith("\t"):
+                        break
+                    if line.startswith(f"\t{device}  "):
+                        return f"{vendor_name} {line[len(device) + 1 :].strip()}"
+                if vendor_name:
+                    return vendor_name
+        except OSError:
+            continue
+    return None
+
+
+def _get_gpu_model_sysfs() -> Optional[str]:
+    try:
+        devices = sorted(PCI_DEVICES_DIR.iterdir())
+    except OSError:
+        return None
+    for dev in devices:
+        try:
+            if not (dev / "class").read_text().startswith(PCI_DISPLAY_CLASS_PREFIX):
+                continue
+            vendor = (dev / "vendor").read_text().strip().lower().removeprefix("0x")
+            device = (dev / "device").read_text().strip().lower().removeprefix("0x")
+        except OSError:
+            continue
+        return _lookup_pci_name(vendor, device) or f"{vendor}:{device}"
+    return None
+
+
+@cache
 def _get_gpu_model() -> str:
+    gpu_name = _get_gpu_model_sysfs()
+    if gpu_name:
+        return gpu_name
     try:
         output = subprocess.check_output(
             ["bash", "-lc", "lspci | grep -i 'vga\|3d' | head -n1"],
@@ -37,6 +104,7 @@ def _get_gpu_model() -> str:
     return "Unknown GPU"
 
 
+@cache
 def _get_ram_gb() -> str:
     try:
         total_gb = psutil.virtual_memory().total / (1024 ** 3)
@@ -45,6 +113,7 @@ def _get_ram_gb() -> str:
         return "Unknown RAM"
 
 
+@cache
 def _get_linux_version() -> str:
     try:
         pretty = _read_os_release()
@@ -69,6 +138,7 @@ def _read_os_release() -> str:
     return ""
 
 
+@cache
 def _get_architecture() -> str:
     arch = (platform.machine() or "Unknown").upper()
     if arch == "AMD64":
@@ -76,32 +146,57 @@ def _get_architecture() -> str:
     return arch.lower() if arch else "unknown"
 
 
+def _load_probe_cache() -> Dict[str, str]:
+    try:
+        data = json.loads(HARDWARE_CACHE_FILE.read_text(encoding="utf-8"))
+        cached_at = float(data.get("cached_at", 0))
+    except Exception:
+        return {}
+    if time.time() - cached_at > HARDWARE_PROBE_CACHE_TTL_SECONDS:
+        return {}
+    return {key: data[key] for key in ("cpu", "gpu") if isinstance(data.get(key), str)}
+
+
+def _store_probe_cache(probes: Dict[str, str]) -> None:
+    tmp_path = HARDWARE_CACHE_FILE.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({**probes, "cached_at": time.time()}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, HARDWARE_CACHE_FILE)
+    except Exception:
+        logging.debug("Failed to write hardware cache", exc_info=True)
+
+
+def _get_probed_models() -> Dict[str, str]:
+    probes = _load_probe_cache()
+    if "cpu" in probes and "gpu" in probes:
+        return probes
+    probes = {"cpu": _get_cpu_model(), "gpu": _get_gpu_model()}
+    if not any(value.startswith("Unknown") for value in probes.values()):
+        _store_probe_cache(probes)
+    return probes
+
+
 def init_hardware_cache() -> None:
     global _HARDWARE_INITIALIZED
     global HARDWARE_TEXT
     if _HARDWARE_INITIALIZED:
         return
+    probes = _get_probed_models()
     HARDWARE_CACHE.update(
         {
-            "cpu": _get_cpu_model(),
-            "gpu": _get_gpu_model(),
+            "cpu": probes["cpu"],
+            "gpu": probes["gpu"],
             "ram": _get_ram_gb(),
             "windows": _get_linux_version(),
             "arch": _get_architecture(),
         }
     )
-    HARDWARE_TEXT = "\n".join(
-        [
-            "🖥️ Железо ПК:",
-            f"🧠 CPU: {HARDWARE_CACHE.get('cpu', 'Unknown CPU')}",
-            f"🎮 GPU: {HARDWARE_CACHE.get('gpu', 'Unknown GPU')}",
-            f"💾 RAM: {HARDWARE_CACHE.get('ram', 'Unknown RAM')}",
-            f"🪟 Windows: {HARDWARE_CACHE.get('windows', 'Unknown Linux')}",
-            f"🧩 Архитектура: {HARDWARE_CACHE.get('arch', 'unknown')}",
-        ]
-    )
+    HARDWARE_TEXT = HARDWARE_TEXT_TEMPLATE.format(**HARDWARE_CACHE)
     _HARDWARE_INITIALIZED = True
 
 
 def build_hardware_text() -> str:
-    return HARDWARE_TEXT or "🖥️ Железо ПК:\n(данные недоступны)"
+    return HARDWARE_TEXT
@@ -1,22 +1,41 @@
 import asyncio
 import logging
-from typing import Any, Dict
+import time
+from typing import Any, Coroutine, Dict, Optional, Tuple
 
 from telegram.ext import Application
 
 from config import OWNER_IDS
-from messages import get_status_keyboard, send_or_edit_status_message
+from messages import get_status_keyboard, is_status_unchanged, send_or_edit_status_message
+from runtime import sleep_until_next_tick
+from snapshot import Snapshot
 from state import (
+    STATE_SAVER,
     ViewMode,
+    active_viewer_count,
     active_viewer_count_global,
-    active_viewers,
+    enabled_chats,
     get_view_stats,
-    prune_expired_viewers,
-    save_state,
 )
 from status import HIDDEN_STATUS_TEXT, build_status_text
 from tracker import get_process_list, get_running_apps, get_snapshot_for_publish, init_tracker_state
-from windows import get_local_date_string
+from windows import get_last_input_idle_seconds, get_local_date_string, list_running_processes
+
+
+LOGGER = logging.getLogger(__name__)
+LIVE_UPDATE_IDLE_MAX_SECONDS = 15.0
+LIVE_UPDATE_IDLE_BACKOFF_FACTOR = 1.5
+
+_LIVE_UPDATE_WAKE = asyncio.Event()
+_HIDDEN_KEYBOARDS = {owner: get_status_keyboard(show_button=True, is_owner=owner) for owner in (False, True)}
+_VISIBLE_KEYBOARDS = {
+    owner: get_status_keyboard(show_button=False, include_hardware=True, is_owner=owner)
+    for owner in (False, True)
+}
+
+
+def request_live_update() -> None:
+    _LIVE_UPDATE_WAKE.set()
 
 
 def _should_pin(chat_state: Dict[str, Any]) -> bool:
@@ -31,6 +50,28 @@ def get_update_interval_seconds(active_viewer_count: int) -> float:
     return 5.5
 
 
+async def build_live_status_text(
+    app: Application, state: Dict[str, Any], viewer_count: Optional[int] = None
+) -> str:
+    tracker = init_tracker_state(app.bot_data)
+    if viewer_count is None:
+        viewer_count = active_viewer_count_global(state)
+    snapshot = get_snapshot_for_publish(tracker)
+    if snapshot is None:
+        snapshot = Snapshot(idle_seconds=await asyncio.to_thread(get_last_input_idle_seconds))
+    process_list = get_process_list(tracker)
+    if not process_list:
+        process_list = await asyncio.to_thread(list_running_processes)
+    return build_status_text(
+        state,
+        snapshot,
+        active_viewer_count=viewer_count,
+        update_interval_seconds=get_update_interval_seconds(viewer_count),
+        running_apps=get_running_apps(tracker),
+        process_list=process_list,
+    )
+
+
 async def update_status_for_chat(
     app: Application,
     chat_id: int,
@@ -39,8 +80,11 @@ async def update_status_for_chat(
     reply_markup=None,
     state: Dict[str, Any] | None = None,
     edit_min_interval: float = 5.0,
-) -> None:
-    logging.info("Chat %s: tick", chat_id)
+) -> bool:
+    if is_status_unchanged(chat_state, text, reply_markup):
+        return False
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Chat %s: tick", chat_id)
     if not chat_state.get("message_id") and _should_pin(chat_state):
         # Will be created by send_or_edit_status_message
         pass
@@ -53,125 +97,124 @@ async def update_status_for_chat(
         state=state,
         edit_min_interval=edit_min_interval,
     )
+    return True
 
 
-async def update_live_status_for_app(app: Application) -> float:
-    state = app.bot_data.get("state")
-    if state is None:
-        return 1.0
+async def _gather_chat_updates(
+    targets: list[tuple[int, Dict[str, Any]]], coroutines: list[Coroutine[Any, Any, bool]]
+) -> bool:
+    if not coroutines:
+        return False
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for task_result, (chat_id, _) in zip(results, targets):
+        if isinstance(task_result, Exception):
+            LOGGER.exception("Chat %s: loop error: %s", chat_id, task_result)
+    return any(result is True for result in results)
 
-    tracker = init_tracker_state(app.bot_data)
 
+async def update_live_status_for_app(app: Application) -> Tuple[float, bool]:
+    state = app.bot_data.get("state")
+    if state is None:
+        return 1.0, True
     if int(app.bot_data.get("ui_busy_count", 0)) > 0:
-        logging.info("Live-update skipped (UI priority)")
-        return 1.0
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Live-update skipped (UI priority)")
+        return 1.0, True
 
     current_date = get_local_date_string()
-    get_view_stats(state, current_date)
+    previous_stats = state.get("view_stats")
+    dirty = get_view_stats(state, current_date) is not previous_stats
     global_active_count = active_viewer_count_global(state)
     update_interval_seconds = get_update_interval_seconds(global_active_count)
-    tasks_info: list[tuple[int, Dict[str, Any], Any]] = []
+    hidden_updates: list[tuple[int, Dict[str, Any]]] = []
+    active_updates: list[tuple[int, Dict[str, Any]]] = []
 
-    for chat_id_str, chat_state in state.get("chats", {}).items():
-        if not chat_state.get("enabled"):
-            continue
+    for chat_id_str, chat_state in enabled_chats(state).items():
         chat_id = int(chat_id_str)
-        prune_expired_viewers(chat_state)
-        active = active_viewers(chat_state)
+        active = active_viewer_count(chat_state)
 
         if not active:
             if chat_state.get("status_visible") or chat_state.get("view_mode") != ViewMode.STATUS.value:
                 chat_state["status_visible"] = False
                 chat_state["view_mode"] = ViewMode.STATUS.value
-                tasks_info.append(
-                    (
-                        chat_id,
-                        chat_state,
-                        update_status_for_chat(
-                            app,
-                            chat_id,
-                            chat_state,
-                            HIDDEN_STATUS_TEXT,
-                            reply_markup=get_status_keyboard(
-                                show_button=True, is_owner=chat_id in OWNER_IDS
-                            ),
-                            state=state,
-                        ),
-                    )
-                )
+                hidden_updates.append((chat_id, chat_state))
+                dirty = True
             continue
 
-        chat_state["status_visible"] = True
+        if not chat_state.get("status_visible"):
+            chat_state["status_visible"] = True
+            dirty = True
         if chat_state.get("callback_in_progress"):
-            logging.info(
-                "Chat %s: live-update skipped (callback in progress)", chat_id
-            )
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Chat %s: live-update skipped (callback in progress)", chat_id)
             continue
         if chat_state.get("view_mode") != ViewMode.STATUS.value:
-            logging.info(
-                "Chat %s: live-update skipped (view=%s)",
-                chat_id,
-                chat_state.get("view_mode"),
-            )
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Chat %s: live-update skipped (view=%s)",
+                    chat_id,
+                    chat_state.get("view_mode"),
+                )
             continue
 
-        tasks_info.append(
-            (
-                chat_id,
-                chat_state,
-                None,
-            )
+        active_updates.append((chat_id, chat_state))
+
+    targets = [
+        (chat_id, chat_state)
+        for chat_id, chat_state in hidden_updates
+        if not chat_state.get("callback_in_progress")
+    ]
+    coroutines = [
+        update_status_for_chat(
+            app,
+            chat_id,
+            chat_state,
+            HIDDEN_STATUS_TEXT,
+            reply_markup=_HIDDEN_KEYBOARDS[chat_id in OWNER_IDS],
+            state=state,
         )
+        for chat_id, chat_state in targets
+    ]
 
-    if tasks_info:
-        snapshot = get_snapshot_for_publish(tracker)
-        running_apps = get_running_apps(tracker)
-        process_list = get_process_list(tracker)
+    if active_updates:
         try:
-            text = build_status_text(
-                state,
-                snapshot,
-                active_viewer_count=global_active_count,
-                update_interval_seconds=update_interval_seconds,
-                running_apps=running_apps,
-                process_list=process_list,
-            )
+            text = await build_live_status_text(app, state, global_active_count)
         except Exception as exc:
-            logging.exception("Failed to build status text: %s", exc)
-            text = None
-
-        if text is not None:
-            coroutines = [
+            LOGGER.exception("Failed to build status text: %s", exc)
+        else:
+            targets.extend(active_updates)
+            coroutines.extend(
                 update_status_for_chat(
                     app,
                     chat_id,
                     chat_state,
                     text,
-                    reply_markup=get_status_keyboard(
-                        show_button=False,
-                        include_hardware=True,
-                        is_owner=chat_id in OWNER_IDS,
-                    ),
+                    reply_markup=_VISIBLE_KEYBOARDS[chat_id in OWNER_IDS],
                     state=state,
                     edit_min_interval=update_interval_seconds,
                 )
-                for chat_id, chat_state, _ in tasks_info
-            ]
-            results = await asyncio.gather(*coroutines, return_exceptions=True)
-            for task_result, (chat_id, _, _) in zip(results, tasks_info):
-                if isinstance(task_result, Exception):
-                    logging.exception("Chat %s: loop error: %s", int(chat_id), task_result)
+                for chat_id, chat_state in active_updates
+            )
+
+    changed = await _gather_chat_updates(targets, coroutines)
 
-    await save_state(state)
-    return update_interval_seconds
+    if changed or dirty:
+        STATE_SAVER.mark_dirty(state)
+    return update_interval_seconds, changed
 
 
 async def live_update_loop(app: Application) -> None:
-    logging.info("Live update loop started")
+    LOGGER.info("Live update loop started")
+    next_tick = time.monotonic()
+    delay = 1.0
     while True:
         try:
-            interval = await update_live_status_for_app(app)
+            interval, changed = await update_live_status_for_app(app)
         except Exception as exc:
-            logging.exception("Live update loop error: %s", exc)
-            interval = 1.0
-        await asyncio.sleep(interval)
+            LOGGER.exception("Live update loop error: %s", exc)
+            interval, changed = 1.0, True
+        if changed:
+            delay = interval
+        else:
+            delay = min(LIVE_UPDATE_IDLE_MAX_SECONDS, max(interval, delay * LIVE_UPDATE_IDLE_BACKOFF_FACTOR))
+        next_tick = await sleep_until_next_tick(next_tick, delay, "Live update", _LIVE_UPDATE_WAKE)
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import logging
+import logging.handlers
 import os
 from pathlib import Path
 
@@ -20,23 +21,38 @@ from handlers import (
 )
 from live_update import live_update_loop
 from hardware import init_hardware_cache
-from state import load_state
+from state import STATE_SAVER, load_state
 from tracker import tracker_loop
 from windows import get_local_date_string
 
 LOG_FILE = Path(__file__).with_name("bot.log")
 LOGGER = logging.getLogger(__name__)
+LOG_BUFFER_CAPACITY = 200
+LOG_FLUSH_INTERVAL_SECONDS = 5.0
+LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 
 
-def configure_logging() -> None:
+def configure_logging() -> logging.handlers.MemoryHandler:
+    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_buffer = logging.handlers.MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+    )
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(message)s",
-        handlers=[logging.FileHandler(LOG_FILE, encoding="utf-8"), logging.StreamHandler()],
+        format=LOG_FORMAT,
+        handlers=[log_buffer, logging.StreamHandler()],
     )
     # Silence verbose HTTP logs like "200 OK" while keeping warnings/errors.
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
+    return log_buffer
+
+
+async def flush_log_buffer_loop(log_buffer: logging.handlers.MemoryHandler) -> None:
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL_SECONDS)
+        log_buffer.flush()
 
 
 def build_application() -> Application:
@@ -62,7 +78,7 @@ def register_handlers(application: Application) -> None:
 
 async def main_async() -> None:
     load_dotenv()
-    configure_logging()
+    log_buffer = configure_logging()
     init_hardware_cache()
     LOGGER.info("Hardware cached before bot start")
     LOGGER.info("Starting Telegram PC Status Bot (polling mode)")
@@ -77,11 +93,15 @@ async def main_async() -> None:
     await application.initialize()
     await startup_reset_chats(application, preexisting_chat_ids)
 
+    log_flush_task = None
     live_task = None
     tracker_task = None
+    saver_task = None
     try:
         await application.start()
         await application.updater.start_polling()
+        log_flush_task = asyncio.create_task(flush_log_buffer_loop(log_buffer))
+        saver_task = asyncio.create_task(STATE_SAVER.run())
         tracker_task = asyncio.create_task(tracker_loop(application))
         live_task = asyncio.create_task(live_update_loop(application))
         wait_call = getattr(application.updater, "wait", None)
@@ -99,7 +119,16 @@ async def main_async() -> None:
             live_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await live_task
+        if saver_task:
+            saver_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await saver_task
+        if log_flush_task:
+            log_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await log_flush_task
         await application.stop()
+        await STATE_SAVER.flush()
         await application.shutdown()
 
 
@@ -0,0 +1,78 @@
+import os
+import socket
+import struct
+from typing import Dict, Set, Tuple
+
+NETLINK_SOCK_DIAG = 4
+SOCK_DIAG_BY_FAMILY = 20
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+TCP_ALL_STATES = 0xFFFFFFFF
+
+_NLMSG_HEADER = struct.Struct("=IHHII")
+_INET_DIAG_REQ_V2 = struct.Struct("=BBBBI48x")
+# family, state, timer, retrans, sport, dport, src, dst, if, cookie, expires, rqueue, wqueue, uid, inode
+_INET_DIAG_MSG = struct.Struct("=BBBBHH16s16sI8sIIIII")
+_RECV_BUFFER_SIZE = 65536
+
+
+def _dump_request(family: int) -> bytes:
+    payload = _INET_DIAG_REQ_V2.pack(family, socket.IPPROTO_TCP, 0, 0, TCP_ALL_STATES)
+    header = _NLMSG_HEADER.pack(
+        _NLMSG_HEADER.size + len(payload),
+        SOCK_DIAG_BY_FAMILY,
+        NLM_F_REQUEST | NLM_F_DUMP,
+        1,
+        0,
+    )
+    return header + payload
+
+
+def _parse_messages(sock: socket.socket, family: int, endpoints: Dict[int, Tuple[str, int]]) -> None:
+    addr_len = 4 if family == socket.AF_INET else 16
+    while True:
+        data = sock.recv(_RECV_BUFFER_SIZE)
+        if not data:
+            return
+        offset = 0
+        while offset + _NLMSG_HEADER.size <= len(data):
+            msg_len, msg_type, _, _, _ = _NLMSG_HEADER.unpack_from(data, offset)
+            if msg_len < _NLMSG_HEADER.size:
+                return
+            if msg_type == NLMSG_DONE:
+                return
+            if msg_type == NLMSG_ERROR:
+                raise OSError("sock_diag dump failed")
+            body = offset + _NLMSG_HEADER.size
+            if msg_type == SOCK_DIAG_BY_FAMILY and body + _INET_DIAG_MSG.size <= len(data):
+                fields = _INET_DIAG_MSG.unpack_from(data, body)
+                dport = socket.ntohs(fields[5])
+                dst = fields[7][:addr_len]
+                inode = fields[14]
+                if dport and inode and any(dst):
+                    endpoints[inode] = (socket.inet_ntop(family, dst), dport)
+            offset += (msg_len + 3) & ~3
+
+
+def tcp_remote_endpoints() -> Dict[int, Tuple[str, int]]:
+    endpoints: Dict[int, Tuple[str, int]] = {}
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_SOCK_DIAG) as sock:
+        for family in (socket.AF_INET, socket.AF_INET6):
+            sock.sendall(_dump_request(family))
+            _parse_messages(sock, family, endpoints)
+    return endpoints
+
+
+def socket_inodes_for_pid(pid: int) -> Set[int]:
+    inodes: Set[int] = set()
+    with os.scandir(f"/proc/{pid}/fd") as entries:
+        for entry in entries:
+            try:
+                target = os.readlink(entry.path)
+            except OSError:
+                continue
+            if target.startswith("socket:["):
+                inodes.add(int(target[8:-1]))
+    return inodes
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Snapshot:
+    timestamp: float = 0.0
+    app_key: str = "unknown"
+    process_name: str = "Unknown"
+    pid: Optional[int] = None
+    create_time: Optional[float] = None
+    app_uptime_seconds: Optional[float] = None
+    title: Optional[str] = None
+    minecraft_version: Optional[str] = None
+    minecraft_server: Optional[str] = None
+    tagline: Optional[str] = None
+    idle_seconds: Optional[float] = None
+
+
+EMPTY_SNAPSHOT = Snapshot()
@@ -1,10 +1,12 @@
 import os
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from presence import PRESENCE_THRESHOLD_SECONDS, PRESENCE_TRACKER, presence_duration_seconds
 from runtime import get_bot_uptime_seconds
+from snapshot import EMPTY_SNAPSHOT, Snapshot
 from state import ensure_app_state
 from windows import (
     get_last_input_idle_seconds,
@@ -29,6 +31,7 @@ BROWSER_PROCESS_NAMES = {
     "opera_gx.exe",
 }
 
+JAVA_PROCESS_NAMES = frozenset({"java.exe", "javaw.exe"})
 PROCESS_ALIASES: Dict[str, str] = {
     **{name: "browser" for name in BROWSER_PROCESS_NAMES},
     "code.exe": "vscode",
@@ -87,12 +90,18 @@ FAVORITE_APPS = {
 
 ACTIVE_THRESHOLD_SECONDS = 300
 
+_STATUS_TEXT_CACHE: Dict[str, Any] = {"key": None, "text": ""}
 
-def format_duration(seconds: float) -> str:
-    seconds = max(0, int(seconds))
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
     return str(timedelta(seconds=seconds))
 
 
+def format_duration(seconds: float) -> str:
+    return _format_whole_seconds(max(0, int(seconds)))
+
+
 def _format_presence_duration(seconds: float, with_suffix: bool = False) -> str:
     seconds = max(0, int(seconds))
     if seconds < 60:
@@ -107,6 +116,7 @@ def _format_presence_duration(seconds: float, with_suffix: bool = False) -> str:
     return f"{hours} ч" + (" назад" if with_suffix else "")
 
 
+@lru_cache(maxsize=1024)
 def resolve_app_key(process_name: Optional[str]) -> str:
     if not process_name:
         return "unknown"
@@ -114,6 +124,7 @@ def resolve_app_key(process_name: Optional[str]) -> str:
     return PROCESS_ALIASES.get(normalized, "unknown")
 
 
+@lru_cache(maxsize=1024)
 def resolve_display_name(app_key: str, process_name: Optional[str], title: Optional[str] = None) -> str:
     if app_key == "minecraft" and title:
         return title
@@ -130,6 +141,11 @@ def resolve_tagline(app_key: str) -> str:
     return TAGLINES.get(app_key, TAGLINES["default"])
 
 
+@lru_cache(maxsize=256)
+def _active_app_lines(display_name: str, tagline: str) -> Tuple[str, str]:
+    return f"🪟 Активное приложение: {display_name}", f"💬 Приписка: {tagline}"
+
+
 def _detect_minecraft_display(process_info: Dict[str, Any]) -> Optional[str]:
     pid = process_info.get("pid")
     if pid is None:
@@ -145,7 +161,7 @@ def _detect_app_key(process_info: Dict[str, Any]) -> (str, Optional[str]):
     if not name:
         return "unknown", None
     lower_name = name.lower()
-    if lower_name in {"java.exe", "javaw.exe"}:
+    if lower_name in JAVA_PROCESS_NAMES:
         title = _detect_minecraft_display(process_info)
         if title:
             return "minecraft", title
@@ -162,11 +178,11 @@ def _collect_running_apps(processes: Optional[List[Dict[str, Any]]] = None) -> D
         current = running.setdefault(
             app_key,
             {
-                "pids": set(),
+                "count": 0,
                 "title": detected_title,
             },
         )
-        current["pids"].add(proc_info.get("pid"))
+        current["count"] += 1
         if detected_title:
             current["title"] = detected_title
     return running
@@ -249,33 +265,75 @@ def _format_update_interval(seconds: float) -> str:
     return f"{seconds:.1f}".rstrip("0").rstrip(".")
 
 
+@lru_cache(maxsize=64)
+def _footer_lines(active_viewer_count: int, update_interval_seconds: float) -> Tuple[str, ...]:
+    if active_viewer_count > 0:
+        viewers_line = f"👀 Сейчас наблюдают за статусом: {active_viewer_count}"
+    else:
+        viewers_line = "😴 Сейчас никто не смотрит"
+    return (
+        "",
+        FOOTER_TEXT,
+        viewers_line,
+        f"⚡ Обновление каждые {_format_update_interval(update_interval_seconds)} сек",
+    )
+
+
 def build_status_text(
     state: Dict[str, Any],
-    snapshot: Optional[Dict[str, Any]],
+    snapshot: Optional[Snapshot],
+    active_viewer_count: int = 0,
+    update_interval_seconds: float = 1.0,
+    running_apps: Optional[Dict[str, Dict[str, Any]]] = None,
+    process_list: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    snapshot_ts = snapshot.timestamp if snapshot else None
+    key = (int(time.time()), snapshot_ts, active_viewer_count, update_interval_seconds)
+    if _STATUS_TEXT_CACHE["key"] == key:
+        return _STATUS_TEXT_CACHE["text"]
+    text = _render_status_text(
+        state,
+        snapshot,
+        active_viewer_count,
+        update_interval_seconds,
+        running_apps,
+        process_list,
+    )
+    _STATUS_TEXT_CACHE["key"] = key
+    _STATUS_TEXT_CACHE["text"] = text
+    return text
+
+
+def _render_status_text(
+    state: Dict[str, Any],
+    snapshot: Optional[Snapshot],
     active_viewer_count: int = 0,
     update_interval_seconds: float = 1.0,
     running_apps: Optional[Dict[str, Dict[str, Any]]] = None,
     process_list: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
     uptime_seconds = get_bot_uptime_seconds()
-    snapshot = snapshot or {}
-    process_name = snapshot.get("process_name") or "Unknown"
-    app_key = snapshot.get("app_key") or resolve_app_key(process_name)
-    minecraft_version = snapshot.get("minecraft_version")
-    minecraft_server = snapshot.get("minecraft_server")
+    if snapshot is None:
+        snapshot = EMPTY_SNAPSHOT
+        idle_seconds = get_last_input_idle_seconds()
+    else:
+        idle_seconds = snapshot.idle_seconds
+    process_name = snapshot.process_name or "Unknown"
+    app_key = snapshot.app_key or resolve_app_key(process_name)
+    minecraft_version = snapshot.minecraft_version
+    minecraft_server = snapshot.minecraft_server
     display_name = (
         f"Minecraft {minecraft_version}" if app_key == "minecraft" and minecraft_version else "Minecraft"
         if app_key == "minecraft"
         else resolve_display_name(app_key, process_name)
     )
-    tagline = snapshot.get("tagline") or resolve_tagline(app_key)
-    app_uptime_seconds = snapshot.get("app_uptime_seconds")
+    tagline = snapshot.tagline or resolve_tagline(app_key)
+    app_uptime_seconds = snapshot.app_uptime_seconds
 
     parts = [
         f"🖥️ Аптайм ПК (с запуска бота): {format_duration(uptime_seconds)}",
         f"⌚ Время на моём ПК: {get_local_time_string()}",
-        f"🪟 Активное приложение: {display_name}",
-        f"💬 Приписка: {tagline}",
+        *_active_app_lines(display_name, tagline),
     ]
 
     if app_uptime_seconds is not None:
@@ -284,11 +342,12 @@ def build_status_text(
     if app_key == "minecraft" and minecraft_server:
         parts.append(f"🌐 Сервер: {minecraft_server}")
 
-    process_count = get_process_count()
+    if process_list is None:
+        process_list = list_running_processes()
+    process_count = len(process_list) if process_list else get_process_count()
     if process_count is not None:
         parts.append(f"🔢 Процессов: {process_count}")
 
-    idle_seconds = get_last_input_idle_seconds()
     presence_info = PRESENCE_TRACKER.observe(idle_seconds)
     presence_duration = presence_duration_seconds(presence_info)
     if presence_info.state == "unknown":
@@ -309,8 +368,6 @@ def build_status_text(
     parts.append("Избранные программы")
     parts.extend(favorite_lines)
 
-    if process_list is None:
-        process_list = list_running_processes()
     work_languages = _detect_work_languages(process_list, os.getpid())
     if work_languages:
         parts.append("")
@@ -318,11 +375,5 @@ def build_status_text(
         for lang in work_languages:
             parts.append(f"• {lang}")
 
-    parts.append("")
-    parts.append(FOOTER_TEXT)
-    if active_viewer_count > 0:
-        parts.append(f"👀 Сейчас наблюдают за статусом: {active_viewer_count}")
-    else:
-        parts.append("😴 Сейчас никто не смотрит")
-    parts.append(f"⚡ Обновление каждые {_format_update_interval(update_interval_seconds)} сек")
+    parts.extend(_footer_lines(active_viewer_count, update_interval_seconds))
     return "\n".join(parts)
@@ -3,24 +3,36 @@ import ipaddress
 import logging
 import re
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import psutil
 
+from netlink_sockdiag import socket_inodes_for_pid, tcp_remote_endpoints
+from runtime import sleep_until_next_tick
+from snapshot import Snapshot
 from state import ensure_app_state
 from status import resolve_app_key, resolve_tagline
 from windows import (
     get_active_process_info,
+    get_last_input_idle_seconds,
     get_process_uptime_seconds,
     get_window_title_for_pid,
     list_running_processes,
 )
 
 MC_VERSION_PATTERN = re.compile(r"\b(\d+\.\d+(?:\.\d+)?[a-z]?)\b")
+TRAILING_LETTERS_PATTERN = re.compile(r"[a-z]+$", re.IGNORECASE)
+_JAVA_NAMES = frozenset({"java", "java.exe", "javaw", "javaw.exe"})
+TRACKER_FULL_SCAN_EVERY_TICKS = 5
+
+
+@lru_cache(maxsize=256)
 def _normalize_version(version: str) -> str:
-    return re.sub(r"[a-z]+$", "", version, flags=re.IGNORECASE)
+    return TRAILING_LETTERS_PATTERN.sub("", version)
 
 
+@lru_cache(maxsize=256)
 def _is_valid_mc_version(version: str) -> bool:
     normalized = _normalize_version(version)
     if normalized.startswith("0."):
@@ -40,8 +52,9 @@ def _is_valid_mc_version(version: str) -> bool:
     return major > 26
 
 
+@lru_cache(maxsize=64)
 def _extract_mc_version(title: Optional[str]) -> Optional[str]:
-    if not title:
+    if not title or "." not in title:
         return None
     for match in MC_VERSION_PATTERN.finditer(title):
         candidate = match.group(1)
@@ -51,33 +64,50 @@ def _extract_mc_version(title: Optional[str]) -> Optional[str]:
 
 
 def _mask_ip(address: str) -> str:
+    # Callers pass addresses already parsed by ipaddress; only dotted IPv4 gets masked.
+    if address.count(".") != 3 or ":" in address:
+        return address
+    second_dot = address.find(".", address.find(".") + 1)
+    return address[:second_dot] + ".***.***"
+
+
+@lru_cache(maxsize=4096)
+def _describe_server_host(host: str) -> str:
     try:
-        ip = ipaddress.ip_address(address)
+        ip = ipaddress.ip_address(host)
+        if ip.is_private or ip.is_loopback:
+            return "LAN"
     except ValueError:
-        return address
-    if isinstance(ip, ipaddress.IPv4Address):
-        parts = address.split(".")
-        if len(parts) == 4:
-            return f"{parts[0]}.{parts[1]}.***.***"
-    return address
+        return host
+    return _mask_ip(host)
+
+
+def _minecraft_server_from_sockdiag(pid: int) -> Optional[str]:
+    inodes = socket_inodes_for_pid(pid)
+    if not inodes:
+        return None
+    endpoints = tcp_remote_endpoints()
+    for inode in inodes:
+        endpoint = endpoints.get(inode)
+        if endpoint:
+            return _describe_server_host(endpoint[0])
+    return None
 
 
 def _minecraft_server_for_pid(pid: int) -> Optional[str]:
+    try:
+        return _minecraft_server_from_sockdiag(pid)
+    except (OSError, ValueError):
+        logging.debug("sock_diag lookup failed for pid %s, using psutil", pid, exc_info=True)
     try:
         proc = psutil.Process(pid)
-        for conn in proc.connections(kind="inet"):
+        for conn in proc.connections(kind="tcp"):
             if not conn.raddr:
                 continue
             host = conn.raddr.ip if hasattr(conn.raddr, "ip") else conn.raddr[0]
             if not host:
                 continue
-            try:
-                ip = ipaddress.ip_address(host)
-                if ip.is_private or ip.is_loopback:
-                    return "LAN"
-            except ValueError:
-                return host
-            return _mask_ip(host)
+            return _describe_server_host(host)
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return None
     except Exception:
@@ -94,8 +124,11 @@ def _detect_minecraft_title(pid: Optional[int]) -> Optional[str]:
     return None
 
 
-def _detect_active_snapshot() -> Dict[str, Any]:
-    process_info = get_active_process_info()
+def _detect_active_snapshot(
+    processes_by_pid: Optional[Dict[int, Dict[str, Any]]] = None,
+    idle_seconds: Optional[float] = None,
+) -> Snapshot:
+    process_info = get_active_process_info(processes_by_pid)
     process_name = process_info.get("name") or "Unknown"
     pid = process_info.get("pid")
     create_time = process_info.get("create_time")
@@ -103,7 +136,7 @@ def _detect_active_snapshot() -> Dict[str, Any]:
     app_key = resolve_app_key(process_name)
     minecraft_title = None
 
-    if process_name.lower() in {"java", "java.exe", "javaw", "javaw.exe"}:
+    if process_name.lower() in _JAVA_NAMES:
         minecraft_title = _detect_minecraft_title(pid)
         if minecraft_title:
             app_key = "minecraft"
@@ -115,18 +148,19 @@ def _detect_active_snapshot() -> Dict[str, Any]:
     minecraft_server = _minecraft_server_for_pid(pid) if app_key == "minecraft" and pid else None
     app_uptime_seconds = get_process_uptime_seconds(create_time)
 
-    return {
-        "timestamp": time.time(),
-        "app_key": app_key,
-        "process_name": process_name,
-        "pid": pid,
-        "create_time": create_time,
-        "app_uptime_seconds": app_uptime_seconds,
-        "title": title,
-        "minecraft_version": minecraft_version,
-        "minecraft_server": minecraft_server,
-        "tagline": resolve_tagline(app_key),
-    }
+    return Snapshot(
+        timestamp=time.time(),
+        app_key=app_key,
+        process_name=process_name,
+        pid=pid,
+        create_time=create_time,
+        app_uptime_seconds=app_uptime_seconds,
+        title=title,
+        minecraft_version=minecraft_version,
+        minecraft_server=minecraft_server,
+        tagline=resolve_tagline(app_key),
+        idle_seconds=idle_seconds,
+    )
 
 
 def _collect_running_apps(processes: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -136,7 +170,7 @@ def _collect_running_apps(processes: List[Dict[str, Any]]) -> Dict[str, Dict[str
         app_key = resolve_app_key(name)
         pid = proc_info.get("pid")
         title = None
-        if name.lower() in {"java", "java.exe", "javaw", "javaw.exe"}:
+        if name.lower() in _JAVA_NAMES:
             minecraft_title = _detect_minecraft_title(pid)
             if minecraft_title:
                 app_key = "minecraft"
@@ -151,25 +185,25 @@ def _collect_running_apps(processes: List[Dict[str, Any]]) -> Dict[str, Dict[str
         current = running.setdefault(
             app_key,
             {
-                "pids": set(),
+                "count": 0,
                 "title": title,
             },
         )
-        current["pids"].add(pid)
+        current["count"] += 1
         if title:
             current["title"] = title
     return running
 
 
-def _update_app_activity(state: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
-    app_key = snapshot.get("app_key")
+def _update_app_activity(state: Dict[str, Any], snapshot: Snapshot) -> None:
+    app_key = snapshot.app_key
     if not app_key or app_key == "unknown":
         return
-    title = snapshot.get("title")
+    title = snapshot.title
     if app_key == "browser":
         title = None
     if app_key == "minecraft":
-        version = snapshot.get("minecraft_version")
+        version = snapshot.minecraft_version
         title = f"Minecraft {version}" if version else "Minecraft"
     app_state = ensure_app_state(state, app_key)
     app_state["last_active_ts"] = time.time()
@@ -184,12 +218,13 @@ def init_tracker_state(bot_data: Dict[str, Any]) -> Dict[str, Any]:
             "last_snapshot": None,
             "running_apps": {},
             "process_list": [],
+            "last_full_scan_ts": None,
         },
     )
     return tracker
 
 
-def get_tracker_snapshot(tracker: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def get_tracker_snapshot(tracker: Dict[str, Any]) -> Optional[Snapshot]:
     return tracker.get("last_snapshot")
 
 
@@ -201,38 +236,46 @@ def get_process_list(tracker: Dict[str, Any]) -> List[Dict[str, Any]]:
     return tracker.get("process_list") or []
 
 
-def get_snapshot_for_publish(tracker: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def get_snapshot_for_publish(tracker: Dict[str, Any]) -> Optional[Snapshot]:
     return tracker.get("last_snapshot")
 
 
-def _collect_snapshot_payload() -> Dict[str, Any]:
-    processes = list_running_processes()
-    snapshot = _detect_active_snapshot()
-    running_apps = _collect_running_apps(processes)
-    return {
-        "snapshot": snapshot,
-        "process_list": processes,
-        "running_apps": running_apps,
-    }
+def _collect_snapshot_payload(full_scan: bool = True) -> Dict[str, Any]:
+    processes = list_running_processes() if full_scan else None
+    snapshot = _detect_active_snapshot(
+        {proc["pid"]: proc for proc in processes} if processes is not None else None,
+        get_last_input_idle_seconds(),
+    )
+    payload: Dict[str, Any] = {"snapshot": snapshot}
+    if processes is not None:
+        payload["process_list"] = processes
+        payload["running_apps"] = _collect_running_apps(processes)
+    return payload
 
 
-def _update_latest_snapshot(tracker: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
+def _update_latest_snapshot(tracker: Dict[str, Any], snapshot: Snapshot) -> None:
     tracker["last_snapshot"] = snapshot
 
 
 async def tracker_loop(app) -> None:
     logging.info("Internal tracker started")
     tracker = init_tracker_state(app.bot_data)
+    tick = 0
+    next_tick = time.monotonic()
     while True:
         try:
-            payload = await asyncio.to_thread(_collect_snapshot_payload)
+            full_scan = tick % TRACKER_FULL_SCAN_EVERY_TICKS == 0
+            tick += 1
+            payload = await asyncio.to_thread(_collect_snapshot_payload, full_scan)
             snapshot = payload["snapshot"]
-            tracker["running_apps"] = payload["running_apps"]
-            tracker["process_list"] = payload["process_list"]
+            if full_scan:
+                tracker["running_apps"] = payload["running_apps"]
+                tracker["process_list"] = payload["process_list"]
+                tracker["last_full_scan_ts"] = time.time()
             _update_latest_snapshot(tracker, snapshot)
             state = app.bot_data.get("state")
             if state:
                 _update_app_activity(state, snapshot)
         except Exception as exc:
             logging.exception("Tracker loop error: %s", exc)
-        await asyncio.sleep(1)
+        next_tick = await sleep_until_next_tick(next_tick, 1.0, "Tracker")
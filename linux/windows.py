@@ -1,12 +1,28 @@
+import os
 import subprocess
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cache, lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import psutil
 
-PROCESS_COUNT_REFRESH_SECONDS = 10
+try:
+    import Xlib.threaded  # noqa: F401 - the shared Display is used from to_thread workers
+    from Xlib import X
+    from Xlib import display as xdisplay
+except ImportError:  # pragma: no cover - optional, subprocess tools are used instead
+    X = None
+    xdisplay = None
+
+PROCESS_COUNT_REFRESH_SECONDS = 30
+ACTIVE_PROCESS_CACHE_SIZE = 32
+WINDOW_TITLES_REFRESH_SECONDS = 1.0
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+_BOOT_TIME = psutil.boot_time()
+_ACTIVE_PROCESS_CACHE: "OrderedDict[int, Tuple[psutil.Process, str, float]]" = OrderedDict()
 
 
 @dataclass
@@ -25,7 +41,63 @@ def _safe_check_output(cmd: List[str]) -> Optional[str]:
         return None
 
 
+@cache
+def _get_x_context() -> Optional[Dict[str, Any]]:
+    if xdisplay is None:
+        return None
+    try:
+        conn = xdisplay.Display()
+    except Exception:
+        return None
+    return {
+        "display": conn,
+        "root": conn.screen().root,
+        "active_window": conn.intern_atom("_NET_ACTIVE_WINDOW"),
+        "client_list": conn.intern_atom("_NET_CLIENT_LIST"),
+        "wm_pid": conn.intern_atom("_NET_WM_PID"),
+        "wm_name": conn.intern_atom("_NET_WM_NAME"),
+        "utf8": conn.intern_atom("UTF8_STRING"),
+    }
+
+
+def _x_property(window: Any, atom: int, prop_type: Optional[int] = None) -> Any:
+    prop = window.get_full_property(atom, X.AnyPropertyType if prop_type is None else prop_type)
+    return prop.value if prop is not None else None
+
+
+def _x_window(ctx: Dict[str, Any], window_id: int) -> Any:
+    return ctx["display"].create_resource_object("window", window_id)
+
+
+def _x_window_title(ctx: Dict[str, Any], window: Any) -> Optional[str]:
+    value = _x_property(window, ctx["wm_name"], ctx["utf8"])
+    if not value:
+        value = window.get_wm_name()
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", "replace")
+    return value or None
+
+
+def _x_failed() -> None:
+    # Drop the connection so the next call reconnects or falls back.
+    if _get_x_context.cache_info().currsize:
+        ctx = _get_x_context()
+        if ctx is not None:
+            try:
+                ctx["display"].close()
+            except Exception:
+                pass
+    _get_x_context.cache_clear()
+
+
 def _get_active_window_id() -> Optional[str]:
+    ctx = _get_x_context()
+    if ctx is not None:
+        try:
+            value = _x_property(ctx["root"], ctx["active_window"])
+            return str(value[0]) if value is not None and len(value) and value[0] else None
+        except Exception:
+            _x_failed()
     # Best-effort: xdotool is common on X11; Wayland environments may return None.
     out = _safe_check_output(["xdotool", "getwindowfocus"])
     if out:
@@ -34,6 +106,13 @@ def _get_active_window_id() -> Optional[str]:
 
 
 def _get_pid_for_window(window_id: str) -> Optional[int]:
+    ctx = _get_x_context()
+    if ctx is not None:
+        try:
+            value = _x_property(_x_window(ctx, int(window_id)), ctx["wm_pid"])
+            return int(value[0]) if value is not None and len(value) else None
+        except Exception:
+            _x_failed()
     out = _safe_check_output(["xprop", "-id", window_id, "_NET_WM_PID"])
     if not out:
         return None
@@ -46,11 +125,44 @@ def _get_pid_for_window(window_id: str) -> Optional[int]:
 
 
 def _get_window_title(window_id: str) -> Optional[str]:
+    ctx = _get_x_context()
+    if ctx is not None:
+        try:
+            return _x_window_title(ctx, _x_window(ctx, int(window_id)))
+        except Exception:
+            _x_failed()
     out = _safe_check_output(["xdotool", "getwindowname", window_id])
     return out or None
 
 
+_WINDOW_TITLES_CACHE: Dict[str, Any] = {"updated_at": 0.0, "titles": {}}
+
+
+def _x_titles_by_pid(ctx: Dict[str, Any]) -> Dict[int, str]:
+    now = time.monotonic()
+    if now - _WINDOW_TITLES_CACHE["updated_at"] < WINDOW_TITLES_REFRESH_SECONDS:
+        return _WINDOW_TITLES_CACHE["titles"]
+    titles: Dict[int, str] = {}
+    for window_id in _x_property(ctx["root"], ctx["client_list"]) or ():
+        window = _x_window(ctx, window_id)
+        pid_value = _x_property(window, ctx["wm_pid"])
+        if pid_value is None or not len(pid_value) or pid_value[0] in titles:
+            continue
+        title = _x_window_title(ctx, window)
+        if title:
+            titles[int(pid_value[0])] = title
+    _WINDOW_TITLES_CACHE["updated_at"] = now
+    _WINDOW_TITLES_CACHE["titles"] = titles
+    return titles
+
+
 def get_window_title_for_pid(pid: int) -> Optional[str]:
+    ctx = _get_x_context()
+    if ctx is not None:
+        try:
+            return _x_titles_by_pid(ctx).get(pid)
+        except Exception:
+            _x_failed()
     # Walk through windows to find a matching PID (best-effort using xprop list)
     try:
         out = _safe_check_output(["wmctrl", "-lp"])
@@ -72,20 +184,42 @@ def get_window_title_for_pid(pid: int) -> Optional[str]:
 
 
 def get_system_uptime_seconds() -> float:
-    boot_time = datetime.fromtimestamp(psutil.boot_time())
-    return (datetime.now() - boot_time).total_seconds()
+    return time.time() - _BOOT_TIME
+
+
+_LOCAL_TIME_CACHE = (0, "")
+_LOCAL_DATE_CACHE = (0, "")
 
 
 def get_local_time_string() -> str:
-    return datetime.now().strftime("%H:%M:%S")
+    global _LOCAL_TIME_CACHE
+    now = int(time.time())
+    cached_at, cached = _LOCAL_TIME_CACHE
+    if cached_at == now:
+        return cached
+    value = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+    _LOCAL_TIME_CACHE = (now, value)
+    return value
 
 
 def get_local_date_string() -> str:
-    return datetime.now().strftime("%Y-%m-%d")
+    global _LOCAL_DATE_CACHE
+    now = int(time.time())
+    cached_at, cached = _LOCAL_DATE_CACHE
+    if cached_at == now:
+        return cached
+    date = datetime.fromtimestamp(now).strftime("%Y-%m-%d")
+    _LOCAL_DATE_CACHE = (now, date)
+    return date
 
 
 def format_local_hhmm(timestamp: float) -> str:
-    return datetime.fromtimestamp(timestamp).strftime("%H:%M")
+    return _format_local_minute(int(timestamp) // 60)
+
+
+@lru_cache(maxsize=256)
+def _format_local_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime("%H:%M")
 
 
 def get_last_input_idle_seconds() -> Optional[float]:
@@ -99,18 +233,46 @@ def get_last_input_idle_seconds() -> Optional[float]:
     return None
 
 
-def get_active_process_info() -> Dict[str, Any]:
+def _active_process_identity(pid: int) -> Tuple[str, float]:
+    cached = _ACTIVE_PROCESS_CACHE.get(pid)
+    if cached is not None:
+        proc, name, create_time = cached
+        if proc.is_running():
+            _ACTIVE_PROCESS_CACHE.move_to_end(pid)
+            return name, create_time
+        del _ACTIVE_PROCESS_CACHE[pid]
+    proc = psutil.Process(pid)
+    with proc.oneshot():
+        name = proc.name()
+        create_time = proc.create_time()
+    _ACTIVE_PROCESS_CACHE[pid] = (proc, name, create_time)
+    if len(_ACTIVE_PROCESS_CACHE) > ACTIVE_PROCESS_CACHE_SIZE:
+        _ACTIVE_PROCESS_CACHE.popitem(last=False)
+    return name, create_time
+
+
+def get_active_process_info(
+    processes_by_pid: Optional[Dict[int, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     try:
         window_id = _get_active_window_id()
         if not window_id:
             return {"name": "Unknown", "pid": None, "create_time": None, "title": None}
         pid = _get_pid_for_window(window_id)
-        proc = psutil.Process(pid) if pid else None
         title = _get_window_title(window_id)
+        cached = processes_by_pid.get(pid) if processes_by_pid and pid else None
+        if cached is not None:
+            name = cached.get("name") or "Unknown"
+            create_time = cached.get("create_time")
+        elif pid:
+            name, create_time = _active_process_identity(pid)
+        else:
+            name = "Unknown"
+            create_time = None
         return {
-            "name": proc.name() if proc else "Unknown",
+            "name": name,
             "pid": pid,
-            "create_time": proc.create_time() if proc else None,
+            "create_time": create_time,
             "title": title,
         }
     except Exception:
@@ -124,7 +286,7 @@ def get_process_uptime_seconds(create_time: Optional[float]) -> Optional[float]:
 
 
 def get_process_count() -> Optional[int]:
-    now = time.time()
+    now = time.monotonic()
     if now - process_count_cache.updated_at >= PROCESS_COUNT_REFRESH_SECONDS:
         try:
             process_count_cache.count = len(psutil.pids())
@@ -134,7 +296,50 @@ def get_process_count() -> Optional[int]:
     return process_count_cache.count
 
 
+def _read_proc_stat(pid_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(f"/proc/{pid_name}/stat", "rb", buffering=0) as fh:
+            data = fh.read()
+        lparen = data.index(b"(")
+        rparen = data.rindex(b")")
+        name = data[lparen + 1 : rparen].decode("utf-8", "replace")
+        start_ticks = int(data[rparen + 2 :].split()[19])
+    except (OSError, ValueError, IndexError):
+        return None
+    if len(name) >= 15:
+        # comm is truncated to 15 chars; recover the full name from argv[0] like psutil does.
+        try:
+            with open(f"/proc/{pid_name}/cmdline", "rb", buffering=0) as fh:
+                argv0 = fh.read().split(b"\0", 1)[0].decode("utf-8", "replace")
+            full_name = os.path.basename(argv0)
+            if full_name.startswith(name):
+                name = full_name
+        except OSError:
+            pass
+    return {
+        "pid": int(pid_name),
+        "name": name,
+        "create_time": _BOOT_TIME + start_ticks / _CLK_TCK,
+    }
+
+
+def _list_processes_from_proc() -> List[Dict[str, Any]]:
+    processes: List[Dict[str, Any]] = []
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            info = _read_proc_stat(entry.name)
+            if info is not None:
+                processes.append(info)
+    return processes
+
+
 def list_running_processes() -> List[Dict[str, Any]]:
+    try:
+        return _list_processes_from_proc()
+    except OSError:
+        pass
     processes: List[Dict[str, Any]] = []
     for proc in psutil.process_iter(attrs=["pid", "name", "create_time"]):
         try:
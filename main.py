@@ -1,11 +1,9 @@
 import importlib
 import os
-import platform
 import sys
 from pathlib import Path
 
 PLATFORM_MAP = {
-    "windows": "windows",
     "win32": "windows",
     "cygwin": "windows",
     "linux": "linux",
@@ -13,8 +11,7 @@ PLATFORM_MAP = {
 
 
 def _detect_platform_folder() -> Path:
-    system_name = platform.system().lower()
-    folder_name = PLATFORM_MAP.get(system_name, "windows")
+    folder_name = PLATFORM_MAP.get(sys.platform, "windows")
     base = Path(__file__).parent / folder_name
     if not base.exists():
         raise RuntimeError(f"Platform folder not found: {base}")
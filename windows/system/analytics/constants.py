@@ -1,2 +1,3 @@
 PAGE_SIZE = 15
 RECENT_VIEW_WINDOW_SECONDS = 300
+STATS_TEXT_CACHE_SIZE = 64
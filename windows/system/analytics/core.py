@@ -1,11 +1,15 @@
 import logging
-import math
 import time
-from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+from itertools import chain, islice
+from typing import Any, Dict, Tuple
 
 from system.config import OWNER_IDS
+from system.state import StatsRow, get_stats_version, sorted_stats_index
 from system.platform import format_local_hhmm
-from .constants import PAGE_SIZE, RECENT_VIEW_WINDOW_SECONDS
+from .constants import PAGE_SIZE, RECENT_VIEW_WINDOW_SECONDS, STATS_TEXT_CACHE_SIZE
+
+_STATS_TEXT_CACHE: "OrderedDict[Tuple[int, int], str]" = OrderedDict()
 
 
 def _format_user_display(user_id: int, entry: Dict[str, Any]) -> str:
@@ -19,62 +23,61 @@ def _format_user_display(user_id: int, entry: Dict[str, Any]) -> str:
 def build_recent_viewers_text(recent_views: Dict[int, Dict[str, Any]]) -> str:
     if not recent_views:
         return "👀 Просмотры статуса (0):\n• Пока никто не смотрел"
-    lines = [f"👀 Просмотры статуса ({len(recent_views)}):"]
-    for user_id, entry in recent_views.items():
-        lines.append(f"• {_format_user_display(user_id, entry)}")
-    return "\n".join(lines)
+    header = f"👀 Просмотры статуса ({len(recent_views)}):"
+    return "\n".join(chain((header,), (f"• {_format_user_display(user_id, entry)}" for user_id, entry in recent_views.items())))
 
 
-def _sorted_stats_entries(stats: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
-    entries = list(stats.get("users", {}).items())
-    entries.sort(
-        key=lambda item: (
-            -int(item[1].get("count", 0)),
-            -(item[1].get("last_view") or 0),
-        )
-    )
-    return entries
+def _render_stats_row(row: StatsRow) -> str:
+    neg_count, neg_last_view, user_id, username, name = row
+    name = name or "User (no username)"
+    if username:
+        display = f"{name} — @{username} (tg://user?id={user_id})"
+    else:
+        display = f"{name} (tg://user?id={user_id})"
+    if neg_last_view:
+        return f"{display} — {-neg_count} раз\n⏱️ последний: {format_local_hhmm(-neg_last_view)}"
+    return f"{display} — {-neg_count} раз"
 
 
 def build_stats_text(stats: Dict[str, Any], page: int) -> str:
-    entries = _sorted_stats_entries(stats)
-    total_pages = max(1, math.ceil(len(entries) / PAGE_SIZE))
+    key = (get_stats_version(stats), page)
+    cached = _STATS_TEXT_CACHE.get(key)
+    if cached is not None:
+        _STATS_TEXT_CACHE.move_to_end(key)
+        return cached
+    text = _render_stats_text(stats, page)
+    _STATS_TEXT_CACHE[key] = text
+    if len(_STATS_TEXT_CACHE) > STATS_TEXT_CACHE_SIZE:
+        _STATS_TEXT_CACHE.popitem(last=False)
+    return text
+
+
+def _render_stats_text(stats: Dict[str, Any], page: int) -> str:
+    index = sorted_stats_index(stats)
+    total_pages = max(1, -(-len(index) // PAGE_SIZE))
     page = max(0, min(page, total_pages - 1))
     start = page * PAGE_SIZE
     end = start + PAGE_SIZE
-    slice_entries = entries[start:end]
+    body = "\n".join(map(_render_stats_row, islice(index, start, end))) or "• Пока нет просмотров"
+    return f"📊 Статистика за сегодня\n{body}\n\nСтраница {page + 1}/{total_pages}"
 
-    lines = ["📊 Статистика за сегодня"]
-    if not slice_entries:
-        lines.append("• Пока нет просмотров")
-    for user_id, entry in slice_entries:
-        display = _format_user_display(int(user_id), entry)
-        count = entry.get("count", 0)
-        last_view = entry.get("last_view")
-        lines.append(f"{display} — {count} раз")
-        if last_view:
-            lines.append(f"⏱️ последний: {format_local_hhmm(last_view)}")
-    lines.append("")
-    lines.append(f"Страница {page + 1}/{total_pages}")
-    return "\n".join(lines)
 
-
-def is_owner(user_id: int | None) -> bool:
-    return user_id in OWNER_IDS
+is_owner = OWNER_IDS.__contains__
 
 
 def prune_recent_views(recent_views: Dict[int, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
-    now = time.time()
+    cutoff = time.time() - RECENT_VIEW_WINDOW_SECONDS
     before = len(recent_views)
-    cleaned = {
-        uid: info
-        for uid, info in recent_views.items()
-        if info.get("last_view") and now - info["last_view"] <= RECENT_VIEW_WINDOW_SECONDS
-    }
-    after = len(cleaned)
-    if before != after:
-        logging.info("Recent views cleaned: before=%s after=%s", before, after)
-    return cleaned
+    expired = []
+    for uid, info in recent_views.items():
+        if info.get("last_view") and info["last_view"] >= cutoff:
+            break
+        expired.append(uid)
+    for uid in expired:
+        del recent_views[uid]
+    if expired:
+        logging.info("Recent views cleaned: before=%s after=%s", before, len(recent_views))
+    return recent_views
 
 
 def add_recent_view(
@@ -84,6 +87,7 @@ def add_recent_view(
     name: str | None,
     timestamp: float,
 ) -> None:
+    recent_views.pop(user_id, None)
     recent_views[user_id] = {
         "user_id": user_id,
         "username": username,
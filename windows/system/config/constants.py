@@ -1,5 +1,7 @@
 import time
+from typing import FrozenSet
 
-OWNER_IDS = [7496285714]
+OWNER_IDS: FrozenSet[int] = frozenset({7496285714})
 GITHUB_URL = "https://github.com/vlalikoffc/telegrambot"
 BOT_START_TIME = time.time()
+BOT_START_MONOTONIC = time.monotonic()
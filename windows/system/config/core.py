@@ -1,3 +1,3 @@
-from .constants import BOT_START_TIME, GITHUB_URL, OWNER_IDS
+from .constants import BOT_START_MONOTONIC, BOT_START_TIME, GITHUB_URL, OWNER_IDS
 
-__all__ = ["BOT_START_TIME", "GITHUB_URL", "OWNER_IDS"]
+__all__ = ["BOT_START_MONOTONIC", "BOT_START_TIME", "GITHUB_URL", "OWNER_IDS"]
@@ -1,12 +1,14 @@
 import asyncio
+import functools
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from telegram import Update
+from telegram import InlineKeyboardMarkup, Update
 from telegram.ext import Application, ContextTypes
 
 from system.analytics import (
+    PAGE_SIZE,
     add_recent_view,
     build_recent_viewers_text,
     build_stats_text,
@@ -18,38 +20,41 @@ from system.messages import (
     get_hardware_keyboard,
     get_stats_keyboard,
     get_viewer_keyboard,
+    is_status_unchanged,
     send_or_edit_status_message,
     send_status_reply_message,
     startup_reset_chat_session,
 )
 from system.state import (
+    STATE_SAVER,
     ViewMode,
-    active_viewer_count_global,
-    active_viewers,
+    ViewerEntry,
+    active_viewer_count,
+    add_viewer,
+    enable_chat,
+    enabled_chats,
     ensure_chat_state,
     format_chat_label,
+    get_chat_lock,
     get_view_stats,
     prune_expired_viewers,
     record_view_event,
     save_state,
 )
-from system.status import HIDDEN_STATUS_TEXT, build_status_text
-from system.tracker import (
-    get_process_list,
-    get_running_apps,
-    get_snapshot_for_publish,
-    init_tracker_state,
-)
-from system.live_update import get_update_interval_seconds
+from system.status import HIDDEN_STATUS_TEXT
+from system.live_update import build_live_status_text, request_live_update
 from system.hardware import build_hardware_text
 from system.platform import get_local_date_string
 
-ANTISPAM_SECONDS = 10
+ANTISPAM_NS = 10_000_000_000
 VIEW_DURATION_SECONDS = 300
 BUTTON_RATE_LIMIT_SECONDS = 2.0
+STARTUP_RESET_BATCH_SIZE = 20
+SHOW_STATUS_DEBOUNCE_SECONDS = 0.05
 
-_callback_locks: dict[int, asyncio.Lock] = {}
 _UI_BUSY_KEY = "ui_busy_count"
+_PENDING_EDIT_KEY = "_pending_edit"
+_REPLIES_IN_FLIGHT: Set[int] = set()
 
 
 class _UiBusy:
@@ -78,25 +83,29 @@ def _update_chat_identity(chat_state: Dict[str, Any], chat, user) -> None:
         chat_state["chat_name"] = getattr(chat, "title", None)
 
 
-def _spawn(app: Application, coro) -> None:
-    async def runner() -> None:
-        try:
-            await coro
-        except Exception:  # pragma: no cover - logged globally
-            logging.exception("Callback task failed")
+async def _safe_runner(coro) -> None:
+    try:
+        await coro
+    except Exception:  # pragma: no cover - logged globally
+        logging.exception("Callback task failed")
 
-    app.create_task(runner())
+
+def _spawn(app: Application, coro) -> asyncio.Task:
+    return app.create_task(_safe_runner(coro))
 
 
 def _can_reply(chat_state: Dict[str, Any]) -> bool:
-    last_ts = chat_state.get("last_user_reply_ts")
-    if not last_ts:
+    last_ns = chat_state.get("last_user_reply_ns")
+    if not last_ns:
         return True
-    return time.time() - last_ts >= ANTISPAM_SECONDS
+    elapsed = time.monotonic_ns() - last_ns
+    # A negative delta means the monotonic clock restarted (reboot) since the last reply.
+    return elapsed >= ANTISPAM_NS or elapsed < 0
 
 
 def _mark_replied(chat_state: Dict[str, Any]) -> None:
-    chat_state["last_user_reply_ts"] = time.time()
+    chat_state.pop("last_user_reply_ts", None)
+    chat_state["last_user_reply_ns"] = time.monotonic_ns()
 
 
 def _log_view_change(chat_id: int, chat_state: Dict[str, Any], old: str, new: str) -> None:
@@ -106,81 +115,147 @@ def _log_view_change(chat_id: int, chat_state: Dict[str, Any], old: str, new: st
 
 
 def _get_recent_views(bot_data: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
-    views = bot_data.setdefault("recent_views", {})
-    cleaned = prune_recent_views(views)
-    bot_data["recent_views"] = cleaned
-    return cleaned
-
-
-def _get_callback_lock(chat_id: int) -> asyncio.Lock:
-    if chat_id not in _callback_locks:
-        _callback_locks[chat_id] = asyncio.Lock()
-    return _callback_locks[chat_id]
+    return prune_recent_views(bot_data.setdefault("recent_views", {}))
 
 
 def _rate_limited_button(chat_state: Dict[str, Any], user_id: int) -> bool:
     last_map = chat_state.setdefault("last_button_ts", {})
-    now = time.time()
-    last = float(last_map.get(str(user_id), 0))
+    now = time.monotonic()
+    key = str(user_id)
+    last = float(last_map.get(key, 0))
     if now - last < BUTTON_RATE_LIMIT_SECONDS:
         return True
-    last_map[str(user_id)] = now
+    last_map.pop(key, None)
+    last_map[key] = now
+    cutoff = now - BUTTON_RATE_LIMIT_SECONDS
+    expired = []
+    for uid, ts in last_map.items():
+        if ts >= cutoff:
+            break
+        expired.append(uid)
+    for uid in expired:
+        del last_map[uid]
     return False
 
 
+async def _run_callback_edit(
+    app: Application,
+    chat_id: int,
+    chat_state: Dict[str, Any],
+    state: Dict[str, Any],
+    text: str,
+    reply_markup: InlineKeyboardMarkup,
+    label: str,
+    start_ts: Optional[float] = None,
+) -> None:
+    if start_ts is None:
+        start_ts = time.monotonic()
+    chat_state["callback_in_progress"] = True
+    logging.info("Callback EDIT start (%s)", label)
+    try:
+        async with _UiBusy(app):
+            await send_or_edit_status_message(
+                app,
+                chat_id,
+                chat_state,
+                text,
+                reply_markup=reply_markup,
+                state=state,
+                skip_rate_limit=True,
+            )
+    finally:
+        chat_state["callback_in_progress"] = False
+        logging.info("Callback EDIT end (%s)", label)
+        logging.info("Callback processed in %.2fs (%s)", time.monotonic() - start_ts, label)
+    STATE_SAVER.mark_dirty(state)
+
+
+def _one_reply_per_chat(
+    handler: Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+) -> Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]:
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        if update.effective_chat is None:
+            return
+        chat_id = update.effective_chat.id
+        if chat_id in _REPLIES_IN_FLIGHT:
+            logging.debug("Chat %s: reply already in flight, dropping duplicate", chat_id)
+            return
+        _REPLIES_IN_FLIGHT.add(chat_id)
+        try:
+            await handler(update, context)
+        finally:
+            _REPLIES_IN_FLIGHT.discard(chat_id)
+
+    return wrapper
+
+
+@_one_reply_per_chat
 async def handle_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if update.effective_chat is None:
         return
     chat_id = update.effective_chat.id
     state = context.application.bot_data["state"]
-    chat_state = ensure_chat_state(state, chat_id)
-    _update_chat_identity(chat_state, update.effective_chat, update.effective_user)
-    chat_state["enabled"] = True
-    chat_state["viewers"] = {}
-    chat_state["status_visible"] = False
-    chat_state["view_mode"] = ViewMode.STATUS.value
-    chat_state["last_sent_text"] = None
-    chat_state["stats_page"] = 0
-    text = HIDDEN_STATUS_TEXT
+    async with get_chat_lock(chat_id):
+        chat_state = ensure_chat_state(state, chat_id)
+        _update_chat_identity(chat_state, update.effective_chat, update.effective_user)
+        chat_state.update(
+            {
+                "viewers": {},
+                "status_visible": False,
+                "view_mode": ViewMode.STATUS.value,
+                "last_sent_hash": None,
+                "last_sent_markup": None,
+                "stats_page": 0,
+            }
+        )
+        enable_chat(state, chat_id)
+        text = HIDDEN_STATUS_TEXT
 
-    await send_or_edit_status_message(
-        context.application,
-        chat_id,
-        chat_state,
-        text,
-        reply_markup=get_status_keyboard(is_owner=is_owner(chat_id)),
-        state=state,
-    )
+        await send_or_edit_status_message(
+            context.application,
+            chat_id,
+            chat_state,
+            text,
+            reply_markup=get_status_keyboard(is_owner=is_owner(chat_id)),
+            state=state,
+        )
 
-    _mark_replied(chat_state)
-    await save_state(state)
+        _mark_replied(chat_state)
+        STATE_SAVER.mark_dirty(state)
 
 
+@_one_reply_per_chat
 async def handle_text(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if update.effective_chat is None:
         return
     chat_id = update.effective_chat.id
     state = context.application.bot_data["state"]
-    chat_state = ensure_chat_state(state, chat_id)
-    _update_chat_identity(chat_state, update.effective_chat, update.effective_user)
-    chat_state["enabled"] = True
-    chat_state["view_mode"] = ViewMode.STATUS.value
-    chat_state["stats_page"] = 0
-
-    if not _can_reply(chat_state):
-        return
+    async with get_chat_lock(chat_id):
+        chat_state = ensure_chat_state(state, chat_id)
+        _update_chat_identity(chat_state, update.effective_chat, update.effective_user)
+        enable_chat(state, chat_id)
+        chat_state["view_mode"] = ViewMode.STATUS.value
+        chat_state["stats_page"] = 0
+
+        if not _can_reply(chat_state):
+            return
 
-    text = HIDDEN_STATUS_TEXT
-    await send_or_edit_status_message(
-        context.application,
-        chat_id,
-        chat_state,
-        text,
-        reply_markup=get_status_keyboard(is_owner=is_owner(chat_id)),
-        state=state,
-    )
-    _mark_replied(chat_state)
-    await save_state(state)
+        text = HIDDEN_STATUS_TEXT
+        reply_markup = get_status_keyboard(is_owner=is_owner(chat_id))
+        if is_status_unchanged(chat_state, text, reply_markup):
+            _mark_replied(chat_state)
+            return
+        await send_or_edit_status_message(
+            context.application,
+            chat_id,
+            chat_state,
+            text,
+            reply_markup=reply_markup,
+            state=state,
+        )
+        _mark_replied(chat_state)
+        STATE_SAVER.mark_dirty(state)
 
 
 async def handle_show_status_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -188,9 +263,10 @@ async def handle_show_status_button(update: Update, context: ContextTypes.DEFAUL
     if not query or not query.message:
         return
     chat_id = query.message.chat_id
-    user_id = query.from_user.id if query.from_user else None
+    user = query.from_user
+    user_id = user.id if user else None
     chat_state = ensure_chat_state(context.application.bot_data["state"], chat_id)
-    _update_chat_identity(chat_state, query.message.chat, query.from_user)
+    _update_chat_identity(chat_state, query.message.chat, user)
     logging.info(
         "Callback received: SHOW_STATUS (chat=%s, user=%s)",
         format_chat_label(chat_id, chat_state),
@@ -206,100 +282,96 @@ async def handle_show_status_button(update: Update, context: ContextTypes.DEFAUL
         return
     await query.answer()
 
-    lock = _get_callback_lock(chat_id)
-    if lock.locked():
-        logging.info("Chat %s: callback ignored (lock busy)", format_chat_label(chat_id, chat_state))
+    prune_expired_viewers(chat_state)
+    if chat_state.get("view_mode") == ViewMode.HARDWARE.value:
+        logging.info(
+            "Chat %s: callback ignored (hardware view active)",
+            format_chat_label(chat_id, chat_state),
+        )
         return
 
-    async def process() -> None:
+    viewers = chat_state.setdefault("viewers", {})
+    username = user.username
+    full_name = user.full_name
+    now_ts = time.time()
+    key = str(user_id)
+    current = viewers.get(key)
+    if current and current.view_expire > now_ts:
+        return
+
+    add_viewer(
+        chat_state,
+        key,
+        ViewerEntry(
+            now_ts,
+            now_ts + VIEW_DURATION_SECONDS,
+            username,
+            full_name,
+            get_local_date_string(),
+        ),
+    )
+    record_view_event(
+        state,
+        get_local_date_string(),
+        user_id,
+        username,
+        full_name,
+        now_ts,
+    )
+    add_recent_view(
+        _get_recent_views(context.application.bot_data),
+        user_id,
+        username,
+        full_name,
+        now_ts,
+    )
+    chat_state["status_visible"] = True
+    enable_chat(state, chat_id)
+    _log_view_change(chat_id, chat_state, chat_state.get("view_mode"), ViewMode.STATUS.value)
+    chat_state["view_mode"] = ViewMode.STATUS.value
+    chat_state["stats_page"] = 0
+    chat_state["callback_in_progress"] = True
+    STATE_SAVER.mark_dirty(state)
+    request_live_update()
+
+    pending = chat_state.get(_PENDING_EDIT_KEY)
+    if pending is None or pending.done():
+        chat_state[_PENDING_EDIT_KEY] = _spawn(
+            context.application,
+            _flush_show_status(context.application, chat_id, chat_state, state),
+        )
+
+
+async def _flush_show_status(
+    app: Application, chat_id: int, chat_state: Dict[str, Any], state: Dict[str, Any]
+) -> None:
+    try:
+        await asyncio.sleep(SHOW_STATUS_DEBOUNCE_SECONDS)
+        chat_state.pop(_PENDING_EDIT_KEY, None)
         start_ts = time.monotonic()
-        lock_inner = _get_callback_lock(chat_id)
-        async with lock_inner:
+        async with get_chat_lock(chat_id):
             prune_expired_viewers(chat_state)
-            if chat_state.get("view_mode") == ViewMode.HARDWARE.value:
-                logging.info(
-                    "Chat %s: callback ignored (hardware view active)",
-                    format_chat_label(chat_id, chat_state),
-                )
+            if chat_state.get("view_mode") != ViewMode.STATUS.value:
                 return
-
-            viewers = chat_state.setdefault("viewers", {})
-            now_ts = time.time()
-            key = str(user_id)
-            current = viewers.get(key)
-            if current and current.get("view_expire") and current["view_expire"] > now_ts:
-                return
-
-            viewers[key] = {
-                "view_start": now_ts,
-                "view_expire": now_ts + VIEW_DURATION_SECONDS,
-                "username": query.from_user.username if query.from_user else None,
-                "name": query.from_user.full_name if query.from_user else None,
-                "stats_date": get_local_date_string(),
-            }
-            record_view_event(
-                state,
-                get_local_date_string(),
-                user_id,
-                query.from_user.username if query.from_user else None,
-                query.from_user.full_name if query.from_user else None,
-                now_ts,
-            )
-            add_recent_view(
-                _get_recent_views(context.application.bot_data),
-                user_id,
-                query.from_user.username if query.from_user else None,
-                query.from_user.full_name if query.from_user else None,
-                now_ts,
-            )
-            chat_state["status_visible"] = True
-            chat_state["enabled"] = True
-            _log_view_change(chat_id, chat_state, chat_state.get("view_mode"), ViewMode.STATUS.value)
-            chat_state["view_mode"] = ViewMode.STATUS.value
-            chat_state["stats_page"] = 0
-
-            tracker = init_tracker_state(context.application.bot_data)
-            plugin_manager = context.application.bot_data.get("plugins")
-            snapshot = get_snapshot_for_publish(tracker)
-            viewer_count = active_viewer_count_global(state)
-            update_interval = get_update_interval_seconds(viewer_count)
-            text = build_status_text(
-                state,
-                snapshot,
-                active_viewer_count=viewer_count,
-                update_interval_seconds=update_interval,
-                running_apps=get_running_apps(tracker),
-                process_list=get_process_list(tracker),
-                plugin_manager=plugin_manager,
-            )
+            text = build_live_status_text(app, state)
             reply_markup = get_status_keyboard(
                 show_button=False,
                 include_hardware=True,
-                is_owner=is_owner(user_id),
-            )
-
-        chat_state["callback_in_progress"] = True
-        logging.info("Callback EDIT start (SHOW_STATUS)")
-        try:
-            async with _UiBusy(context.application):
-                await send_or_edit_status_message(
-                    context.application,
-                    chat_id,
-                    chat_state,
-                    text,
-                    reply_markup=reply_markup,
-                    state=state,
-                    skip_rate_limit=True,
-                )
-        finally:
-            chat_state["callback_in_progress"] = False
-            logging.info("Callback EDIT end (SHOW_STATUS)")
-            logging.info(
-                "Callback processed in %.2fs (SHOW_STATUS)", time.monotonic() - start_ts
+                is_owner=is_owner(chat_id),
             )
-        await save_state(state)
 
-    _spawn(context.application, process())
+        await _run_callback_edit(
+            app,
+            chat_id,
+            chat_state,
+            state,
+            text,
+            reply_markup,
+            "SHOW_STATUS",
+            start_ts,
+        )
+    finally:
+        chat_state["callback_in_progress"] = False
 
 
 async def handle_viewer_info_button(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -326,7 +398,7 @@ async def handle_viewer_info_button(update: Update, context: ContextTypes.DEFAUL
     if rate_limited or unauthorized:
         return
 
-    lock = _get_callback_lock(chat_id)
+    lock = get_chat_lock(chat_id)
     if lock.locked():
         logging.info("Chat %s: callback ignored (lock busy)", format_chat_label(chat_id, chat_state))
         return
@@ -337,7 +409,7 @@ async def handle_viewer_info_button(update: Update, context: ContextTypes.DEFAUL
             return
 
         chat_state_inner = ensure_chat_state(state_inner, chat_id)
-        lock_inner = _get_callback_lock(chat_id)
+        lock_inner = get_chat_lock(chat_id)
         async with lock_inner:
             prune_expired_viewers(chat_state_inner)
             chat_state_inner["view_mode"] = ViewMode.VIEWERS.value
@@ -346,105 +418,22 @@ async def handle_viewer_info_button(update: Update, context: ContextTypes.DEFAUL
             text = build_recent_viewers_text(recent_views)
             reply_markup = get_viewer_keyboard(include_stats=True)
 
-        chat_state_inner["callback_in_progress"] = True
-        logging.info("Callback EDIT start (VIEWER_INFO)")
-        start_ts = time.monotonic()
-        try:
-            async with _UiBusy(context.application):
-                await send_or_edit_status_message(
-                    context.application,
-                    chat_id,
-                    chat_state_inner,
-                    text,
-                    reply_markup=reply_markup,
-                    state=state_inner,
-                    skip_rate_limit=True,
-                )
-        finally:
-            chat_state_inner["callback_in_progress"] = False
-            logging.info("Callback EDIT end (VIEWER_INFO)")
-            logging.info(
-                "Callback processed in %.2fs (VIEWER_INFO)",
-                time.monotonic() - start_ts,
-            )
-        await save_state(state_inner)
-
-    _spawn(context.application, process())
-
-
-async def handle_viewer_stats(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    query = update.callback_query
-    if not query or not query.message:
-        return
-    chat_id = query.message.chat_id
-    user_id = query.from_user.id if query.from_user else None
-    state = context.application.bot_data.get("state")
-    chat_state = ensure_chat_state(state, chat_id) if state else None
-    if chat_state:
-        _update_chat_identity(chat_state, query.message.chat, query.from_user)
-    logging.info(
-        "Callback received: VIEWER_STATS (chat=%s, user=%s)",
-        format_chat_label(chat_id, chat_state),
-        user_id,
-    )
-    rate_limited = bool(chat_state and user_id is not None and _rate_limited_button(chat_state, user_id))
-    unauthorized = user_id is None or not is_owner(user_id)
-    await query.answer(
-        text="⏳ Подожди секунду" if rate_limited else ("Недостаточно прав" if unauthorized else None),
-        show_alert=unauthorized,
-    )
-    if rate_limited or unauthorized:
-        return
-
-    lock = _get_callback_lock(chat_id)
-    if lock.locked():
-        logging.info("Chat %s: callback ignored (lock busy)", format_chat_label(chat_id, chat_state))
-        return
-
-    async def process() -> None:
-        user_inner = query.from_user.id if query.from_user else None
-        chat_id_inner = query.message.chat_id
-        state_inner = context.application.bot_data.get("state")
-        if user_inner is None or state_inner is None:
-            return
-        chat_state_inner = ensure_chat_state(state_inner, chat_id_inner)
-        lock_inner = _get_callback_lock(chat_id_inner)
-        async with lock_inner:
-            chat_state_inner["view_mode"] = ViewMode.STATS.value
-            stats = get_view_stats(state_inner, get_local_date_string())
-            total = max(1, (len(stats.get("users", {})) + 14) // 15)
-            page = max(0, min(chat_state_inner.get("stats_page", 0), total - 1))
-            chat_state_inner["stats_page"] = page
-            text = build_stats_text(stats, page)
-            reply_markup = get_stats_keyboard(page > 0, page < total - 1, page)
-
-        chat_state_inner["callback_in_progress"] = True
-        logging.info("Callback EDIT start (VIEWER_STATS)")
-        start_ts = time.monotonic()
-        try:
-            async with _UiBusy(context.application):
-                await send_or_edit_status_message(
-                    context.application,
-                    chat_id_inner,
-                    chat_state_inner,
-                    text,
-                    reply_markup=reply_markup,
-                    state=state_inner,
-                    skip_rate_limit=True,
-                )
-        finally:
-            chat_state_inner["callback_in_progress"] = False
-            logging.info("Callback EDIT end (VIEWER_STATS)")
-            logging.info(
-                "Callback processed in %.2fs (VIEWER_STATS)",
-                time.monotonic() - start_ts,
-            )
-        await save_state(state_inner)
+        await _run_callback_edit(
+            context.application,
+            chat_id,
+            chat_state_inner,
+            state_inner,
+            text,
+            reply_markup,
+            "VIEWER_INFO",
+        )
 
     _spawn(context.application, process())
 
 
-async def handle_viewer_stats_page(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+async def _handle_stats_callback(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, label: str, page_data: Optional[str]
+) -> None:
     query = update.callback_query
     if not query or not query.message:
         return
@@ -455,7 +444,8 @@ async def handle_viewer_stats_page(update: Update, context: ContextTypes.DEFAULT
     if chat_state:
         _update_chat_identity(chat_state, query.message.chat, query.from_user)
     logging.info(
-        "Callback received: VIEWER_STATS_PAGE (chat=%s, user=%s)",
+        "Callback received: %s (chat=%s, user=%s)",
+        label,
         format_chat_label(chat_id, chat_state),
         user_id,
     )
@@ -468,20 +458,19 @@ async def handle_viewer_stats_page(update: Update, context: ContextTypes.DEFAULT
     if rate_limited or unauthorized:
         return
 
-    lock = _get_callback_lock(chat_id)
+    lock = get_chat_lock(chat_id)
     if lock.locked():
         logging.info("Chat %s: callback ignored (lock busy)", format_chat_label(chat_id, chat_state))
         return
 
     async def process() -> None:
-        data = query.data or ""
-        parts = data.split(":", 1)
-        if len(parts) != 2:
-            return
-        try:
-            page = int(parts[1])
-        except ValueError:
-            return
+        if page_data is not None:
+            _, _, tail = page_data.partition(":")
+            if not tail.isdecimal():
+                return
+            requested_page: Optional[int] = int(tail)
+        else:
+            requested_page = None
 
         user_inner = query.from_user.id if query.from_user else None
         chat_id_inner = query.message.chat_id
@@ -489,42 +478,41 @@ async def handle_viewer_stats_page(update: Update, context: ContextTypes.DEFAULT
         if user_inner is None or state_inner is None:
             return
         chat_state_inner = ensure_chat_state(state_inner, chat_id_inner)
-        lock_inner = _get_callback_lock(chat_id_inner)
+        lock_inner = get_chat_lock(chat_id_inner)
         async with lock_inner:
             stats = get_view_stats(state_inner, get_local_date_string())
-            total = max(1, (len(stats.get("users", {})) + 14) // 15)
-            page_inner = max(0, min(page, total - 1))
+            total = max(1, -(-len(stats.get("users", {})) // PAGE_SIZE))
+            if requested_page is None:
+                requested_page = chat_state_inner.get("stats_page", 0)
+            page_inner = max(0, min(requested_page, total - 1))
             chat_state_inner["view_mode"] = ViewMode.STATS.value
             chat_state_inner["stats_page"] = page_inner
             text = build_stats_text(stats, page_inner)
             reply_markup = get_stats_keyboard(page_inner > 0, page_inner < total - 1, page_inner)
 
-        chat_state_inner["callback_in_progress"] = True
-        logging.info("Callback EDIT start (VIEWER_STATS_PAGE)")
-        start_ts = time.monotonic()
-        try:
-            async with _UiBusy(context.application):
-                await send_or_edit_status_message(
-                    context.application,
-                    chat_id_inner,
-                    chat_state_inner,
-                    text,
-                    reply_markup=reply_markup,
-                    state=state_inner,
-                    skip_rate_limit=True,
-                )
-        finally:
-            chat_state_inner["callback_in_progress"] = False
-            logging.info("Callback EDIT end (VIEWER_STATS_PAGE)")
-            logging.info(
-                "Callback processed in %.2fs (VIEWER_STATS_PAGE)",
-                time.monotonic() - start_ts,
-            )
-        await save_state(state_inner)
+        await _run_callback_edit(
+            context.application,
+            chat_id_inner,
+            chat_state_inner,
+            state_inner,
+            text,
+            reply_markup,
+            label,
+        )
 
     _spawn(context.application, process())
 
 
+async def handle_viewer_stats(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    await _handle_stats_callback(update, context, "VIEWER_STATS", None)
+
+
+async def handle_viewer_stats_page(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    query = update.callback_query
+    page_data = (query.data or "") if query else ""
+    await _handle_stats_callback(update, context, "VIEWER_STATS_PAGE", page_data)
+
+
 async def handle_show_hardware(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     if not query or not query.message:
@@ -545,7 +533,7 @@ async def handle_show_hardware(update: Update, context: ContextTypes.DEFAULT_TYP
     if rate_limited:
         return
 
-    lock = _get_callback_lock(chat_id)
+    lock = get_chat_lock(chat_id)
     if lock.locked():
         logging.info("Chat %s: callback ignored (lock busy)", format_chat_label(chat_id, chat_state))
         return
@@ -555,7 +543,7 @@ async def handle_show_hardware(update: Update, context: ContextTypes.DEFAULT_TYP
         if state_inner is None:
             return
         chat_state_inner = ensure_chat_state(state_inner, chat_id)
-        lock_inner = _get_callback_lock(chat_id)
+        lock_inner = get_chat_lock(chat_id)
         async with lock_inner:
             if chat_state_inner.get("view_mode") == ViewMode.HARDWARE.value:
                 logging.info(
@@ -576,28 +564,15 @@ async def handle_show_hardware(update: Update, context: ContextTypes.DEFAULT_TYP
             text = build_hardware_text()
             reply_markup = get_hardware_keyboard()
 
-        chat_state_inner["callback_in_progress"] = True
-        logging.info("Callback EDIT start (SHOW_HARDWARE)")
-        start_ts = time.monotonic()
-        try:
-            async with _UiBusy(context.application):
-                await send_or_edit_status_message(
-                    context.application,
-                    chat_id,
-                    chat_state_inner,
-                    text,
-                    reply_markup=reply_markup,
-                    state=state_inner,
-                    skip_rate_limit=True,
-                )
-        finally:
-            chat_state_inner["callback_in_progress"] = False
-            logging.info("Callback EDIT end (SHOW_HARDWARE)")
-            logging.info(
-                "Callback processed in %.2fs (SHOW_HARDWARE)",
-                time.monotonic() - start_ts,
-            )
-        await save_state(state_inner)
+        await _run_callback_edit(
+            context.application,
+            chat_id,
+            chat_state_inner,
+            state_inner,
+            text,
+            reply_markup,
+            "SHOW_HARDWARE",
+        )
 
     _spawn(context.application, process())
 
@@ -624,8 +599,7 @@ async def handle_back_to_status(update: Update, context: ContextTypes.DEFAULT_TY
         if state_inner is None:
             return
         chat_state_inner = ensure_chat_state(state_inner, chat_id)
-        prune_expired_viewers(chat_state_inner)
-        active = active_viewers(chat_state_inner)
+        active = active_viewer_count(chat_state_inner)
         old_view = chat_state_inner.get("view_mode")
         _log_view_change(chat_id, chat_state_inner, old_view, ViewMode.STATUS.value)
         chat_state_inner["view_mode"] = ViewMode.STATUS.value
@@ -635,53 +609,60 @@ async def handle_back_to_status(update: Update, context: ContextTypes.DEFAULT_TY
             reply_markup = get_status_keyboard(show_button=True, is_owner=is_owner(chat_id))
         else:
             chat_state_inner["status_visible"] = True
-            tracker = init_tracker_state(context.application.bot_data)
-            plugin_manager = context.application.bot_data.get("plugins")
-            snapshot = get_snapshot_for_publish(tracker)
-            viewer_count = active_viewer_count_global(state_inner)
-            update_interval = get_update_interval_seconds(viewer_count)
-            text = build_status_text(
-                state_inner,
-                snapshot,
-                active_viewer_count=viewer_count,
-                update_interval_seconds=update_interval,
-                running_apps=get_running_apps(tracker),
-                process_list=get_process_list(tracker),
-                plugin_manager=plugin_manager,
-            )
+            text = build_live_status_text(context.application, state_inner)
             reply_markup = get_status_keyboard(
                 show_button=False,
                 include_hardware=True,
                 is_owner=is_owner(chat_id),
             )
 
-        chat_state_inner["callback_in_progress"] = True
-        logging.info("Callback EDIT start (BACK_TO_STATUS)")
         logging.info("BACK_TO_STATUS forced transition executed (chat=%s)", chat_id)
-        start_ts = time.monotonic()
-        try:
-            async with _UiBusy(context.application):
-                await send_or_edit_status_message(
-                    context.application,
-                    chat_id,
-                    chat_state_inner,
-                    text,
-                    reply_markup=reply_markup,
-                    state=state_inner,
-                    skip_rate_limit=True,
-                )
-        finally:
-            chat_state_inner["callback_in_progress"] = False
-            logging.info("Callback EDIT end (BACK_TO_STATUS)")
-            logging.info(
-                "Callback processed in %.2fs (BACK_TO_STATUS)",
-                time.monotonic() - start_ts,
-            )
-        await save_state(state_inner)
+        await _run_callback_edit(
+            context.application,
+            chat_id,
+            chat_state_inner,
+            state_inner,
+            text,
+            reply_markup,
+            "BACK_TO_STATUS",
+        )
 
     _spawn(context.application, process())
 
 
+async def _fetch_missing_chat_types(
+    app: Application, targets: List[Tuple[int, Dict[str, Any]]]
+) -> None:
+    missing = [(chat_id, chat_state) for chat_id, chat_state in targets if not chat_state.get("chat_type")]
+    for start in range(0, len(missing), STARTUP_RESET_BATCH_SIZE):
+        batch = missing[start : start + STARTUP_RESET_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(app.bot.get_chat(chat_id) for chat_id, _ in batch),
+            return_exceptions=True,
+        )
+        for (chat_id, chat_state), result in zip(batch, results):
+            if isinstance(result, Exception):
+                logging.warning("Failed to fetch chat info for %s: %s", chat_id, result)
+                continue
+            chat_state["chat_type"] = result.type
+
+
+async def _startup_reset_chat(
+    app: Application, state: Dict[str, Any], chat_id: int, chat_state: Dict[str, Any]
+) -> None:
+    chat_state.update({"viewers": {}, "status_visible": False})
+    text = HIDDEN_STATUS_TEXT
+    await startup_reset_chat_session(
+        app,
+        chat_id,
+        chat_state,
+        text,
+        reply_markup=get_status_keyboard(is_owner=is_owner(chat_id)),
+        include_restart_notice=True,
+        state=state,
+    )
+
+
 async def startup_reset_chats(app: Application, preexisting_chat_ids: set[int]) -> None:
     state = app.bot_data.get("state")
     if state is None:
@@ -690,33 +671,26 @@ async def startup_reset_chats(app: Application, preexisting_chat_ids: set[int])
     if app.bot_data.get("startup_reset_done"):
         return
 
-    for chat_id_str, chat_state in state.get("chats", {}).items():
-        chat_id = int(chat_id_str)
-        if chat_id not in preexisting_chat_ids:
-            continue
-        if not chat_state.get("enabled"):
-            continue
-        chat_type = chat_state.get("chat_type")
-        if not chat_type:
-            try:
-                chat = await app.bot.get_chat(chat_id)
-                chat_type = chat.type
-                chat_state["chat_type"] = chat_type
-            except Exception as exc:
-                logging.warning("Failed to fetch chat info for %s: %s", chat_id, exc)
-                continue
-        chat_state["viewers"] = {}
-        chat_state["status_visible"] = False
-        text = HIDDEN_STATUS_TEXT
-        await startup_reset_chat_session(
-            app,
-            chat_id,
-            chat_state,
-            text,
-            reply_markup=get_status_keyboard(is_owner=is_owner(chat_id)),
-            include_restart_notice=True,
-            state=state,
+    targets = [
+        (int(chat_id_str), chat_state)
+        for chat_id_str, chat_state in enabled_chats(state).items()
+        if int(chat_id_str) in preexisting_chat_ids
+    ]
+    await _fetch_missing_chat_types(app, targets)
+    targets = [(chat_id, chat_state) for chat_id, chat_state in targets if chat_state.get("chat_type")]
+    for start in range(0, len(targets), STARTUP_RESET_BATCH_SIZE):
+        batch = targets[start : start + STARTUP_RESET_BATCH_SIZE]
+        results = await asyncio.gather(
+            *(_startup_reset_chat(app, state, chat_id, chat_state) for chat_id, chat_state in batch),
+            return_exceptions=True,
         )
+        for (chat_id, chat_state), result in zip(batch, results):
+            if isinstance(result, Exception):
+                logging.warning(
+                    "Chat %s: startup reset failed: %s",
+                    format_chat_label(chat_id, chat_state),
+                    result,
+                )
 
     app.bot_data["startup_reset_done"] = True
     await save_state(state)
@@ -1 +1,13 @@
 """Module constants for internal system component."""
+CPU_REGISTRY_KEY = r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+GPU_REGISTRY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+HARDWARE_PROBE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+HARDWARE_TEXT_TEMPLATE = (
+    "🖥️ Железо ПК:\n"
+    "🧠 CPU: {cpu}\n"
+    "🎮 GPU: {gpu}\n"
+    "💾 RAM: {ram}\n"
+    "🪟 Windows: {windows}\n"
+    "🧩 Архитектура: {arch}"
+)
+HARDWARE_UNAVAILABLE_TEXT = "🖥️ Железо ПК:\n(данные недоступны)"
@@ -1,17 +1,44 @@
+import json
 import logging
+import os
 import platform
 import subprocess
-from typing import Dict, List
+import time
+from functools import cache
+import winreg
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import psutil
 
+from .constants import (
+    CPU_REGISTRY_KEY,
+    GPU_REGISTRY_CLASS_KEY,
+    HARDWARE_PROBE_CACHE_TTL_SECONDS,
+    HARDWARE_TEXT_TEMPLATE,
+    HARDWARE_UNAVAILABLE_TEXT,
+)
 
+HARDWARE_CACHE_FILE = Path(__file__).resolve().parents[2] / "hardware_cache.json"
 HARDWARE_CACHE: Dict[str, str] = {}
-HARDWARE_TEXT = ""
+HARDWARE_TEXT = HARDWARE_UNAVAILABLE_TEXT
 _HARDWARE_INITIALIZED = False
 
 
+def _read_registry_value(path: str, name: str) -> Optional[str]:
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as key:
+            value, _ = winreg.QueryValueEx(key, name)
+    except OSError:
+        return None
+    return str(value).strip() or None
+
+
+@cache
 def _get_cpu_model() -> str:
+    cpu_name = _read_registry_value(CPU_REGISTRY_KEY, "ProcessorNameString")
+    if cpu_name:
+        return cpu_name
     cpu_name = platform.processor()
     if cpu_name and "Family" not in cpu_name and "Model" not in cpu_name:
         return cpu_name
@@ -30,7 +57,31 @@ def _get_cpu_model() -> str:
     return cpu_name or "Unknown CPU"
 
 
+def _get_gpu_model_from_registry() -> Optional[str]:
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, GPU_REGISTRY_CLASS_KEY) as key:
+            index = 0
+            while True:
+                try:
+                    subkey = winreg.EnumKey(key, index)
+                except OSError:
+                    return None
+                index += 1
+                if not subkey.isdigit():
+                    continue
+                name = _read_registry_value(f"{GPU_REGISTRY_CLASS_KEY}\\{subkey}", "DriverDesc")
+                if name:
+                    return name
+    except OSError:
+        logging.debug("GPU detection via registry failed", exc_info=True)
+    return None
+
+
+@cache
 def _get_gpu_model() -> str:
+    gpu_name = _get_gpu_model_from_registry()
+    if gpu_name:
+        return gpu_name
     try:
         output = subprocess.check_output(
             ["wmic", "path", "win32_VideoController", "get", "Name"],
@@ -46,6 +97,7 @@ def _get_gpu_model() -> str:
     return "Unknown GPU"
 
 
+@cache
 def _get_ram_gb() -> str:
     try:
         total_gb = psutil.virtual_memory().total / (1024 ** 3)
@@ -54,12 +106,14 @@ def _get_ram_gb() -> str:
         return "Unknown RAM"
 
 
+@cache
 def _get_windows_version() -> str:
     version = platform.version()
     release = platform.release()
     return f"Windows {release} ({version})"
 
 
+@cache
 def _get_architecture() -> str:
     arch = (platform.machine() or "Unknown").upper()
     if arch == "AMD64":
@@ -67,33 +121,58 @@ def _get_architecture() -> str:
     return arch.lower() if arch else "unknown"
 
 
+def _load_probe_cache() -> Dict[str, str]:
+    try:
+        data = json.loads(HARDWARE_CACHE_FILE.read_text(encoding="utf-8"))
+        cached_at = float(data.get("cached_at", 0))
+    except Exception:
+        return {}
+    if time.time() - cached_at > HARDWARE_PROBE_CACHE_TTL_SECONDS:
+        return {}
+    return {key: data[key] for key in ("cpu", "gpu") if isinstance(data.get(key), str)}
+
+
+def _store_probe_cache(probes: Dict[str, str]) -> None:
+    tmp_path = HARDWARE_CACHE_FILE.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({**probes, "cached_at": time.time()}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, HARDWARE_CACHE_FILE)
+    except Exception:
+        logging.debug("Failed to write hardware cache", exc_info=True)
+
+
+def _get_probed_models() -> Dict[str, str]:
+    probes = _load_probe_cache()
+    if "cpu" in probes and "gpu" in probes:
+        return probes
+    probes = {"cpu": _get_cpu_model(), "gpu": _get_gpu_model()}
+    if not any(value.startswith("Unknown") for value in probes.values()):
+        _store_probe_cache(probes)
+    return probes
+
+
 def init_hardware_cache() -> None:
     global _HARDWARE_INITIALIZED
     global HARDWARE_TEXT
     if _HARDWARE_INITIALIZED:
         return
+    probes = _get_probed_models()
     HARDWARE_CACHE.update(
         {
-            "cpu": _get_cpu_model(),
-            "gpu": _get_gpu_model(),
+            "cpu": probes["cpu"],
+            "gpu": probes["gpu"],
             "ram": _get_ram_gb(),
             "windows": _get_windows_version(),
             "arch": _get_architecture(),
         }
     )
-    HARDWARE_TEXT = "\n".join(
-        [
-            "🖥️ Железо ПК:",
-            f"🧠 CPU: {HARDWARE_CACHE.get('cpu', 'Unknown CPU')}",
-            f"🎮 GPU: {HARDWARE_CACHE.get('gpu', 'Unknown GPU')}",
-            f"💾 RAM: {HARDWARE_CACHE.get('ram', 'Unknown RAM')}",
-            f"🪟 Windows: {HARDWARE_CACHE.get('windows', 'Unknown Windows')}",
-            f"🧩 Архитектура: {HARDWARE_CACHE.get('arch', 'unknown')}",
-        ]
-    )
+    HARDWARE_TEXT = HARDWARE_TEXT_TEMPLATE.format(**HARDWARE_CACHE)
     _HARDWARE_INITIALIZED = True
 
 
 def build_hardware_text() -> str:
-    return HARDWARE_TEXT or "🖥️ Железо ПК:\n(данные недоступны)"
+    return HARDWARE_TEXT
 
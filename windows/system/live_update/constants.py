@@ -1 +1,3 @@
 """Module constants for internal system component."""
+LIVE_UPDATE_IDLE_MAX_SECONDS = 15.0
+LIVE_UPDATE_IDLE_BACKOFF_FACTOR = 1.5
@@ -1,25 +1,42 @@
 import asyncio
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Coroutine, Dict, Optional, Tuple
 
 from telegram.ext import Application
 
 from system.config import OWNER_IDS
-from system.messages import get_status_keyboard, send_or_edit_status_message
+from system.messages import get_status_keyboard, is_status_unchanged, send_or_edit_status_message
+from system.runtime import sleep_until_next_tick
 from system.state import (
+    STATE_SAVER,
     ViewMode,
+    active_viewer_count,
     active_viewer_count_global,
-    active_viewers,
+    enabled_chats,
     format_chat_label,
     get_view_stats,
-    prune_expired_viewers,
     record_view_event,
-    save_state,
 )
 from system.status import HIDDEN_STATUS_TEXT, build_status_text
 from system.tracker import get_process_list, get_running_apps, get_snapshot_for_publish, init_tracker_state
 from system.platform import get_local_date_string
+from .constants import (
+    LIVE_UPDATE_IDLE_BACKOFF_FACTOR,
+    LIVE_UPDATE_IDLE_MAX_SECONDS,
+)
+
+
+_LIVE_UPDATE_WAKE = asyncio.Event()
+_HIDDEN_KEYBOARDS = {owner: get_status_keyboard(show_button=True, is_owner=owner) for owner in (False, True)}
+_VISIBLE_KEYBOARDS = {
+    owner: get_status_keyboard(show_button=False, include_hardware=True, is_owner=owner)
+    for owner in (False, True)
+}
+
+
+def request_live_update() -> None:
+    _LIVE_UPDATE_WAKE.set()
 
 
 def _should_pin(chat_state: Dict[str, Any]) -> bool:
@@ -28,21 +45,23 @@ def _should_pin(chat_state: Dict[str, Any]) -> bool:
 
 def _ensure_daily_stats_for_viewers(
     state: Dict[str, Any], chat_state: Dict[str, Any], current_date: str
-) -> None:
+) -> bool:
+    recorded = False
     viewers = chat_state.get("viewers") or {}
     for user_id, info in viewers.items():
-        stats_date = info.get("stats_date")
-        if stats_date == current_date:
+        if info.stats_date == current_date:
             continue
         record_view_event(
             state,
             current_date,
             int(user_id),
-            info.get("username"),
-            info.get("name"),
+            info.username,
+            info.name,
             time.time(),
         )
-        info["stats_date"] = current_date
+        info.stats_date = current_date
+        recorded = True
+    return recorded
 
 
 def get_update_interval_seconds(active_viewer_count: int) -> float:
@@ -53,6 +72,23 @@ def get_update_interval_seconds(active_viewer_count: int) -> float:
     return 5.5
 
 
+def build_live_status_text(
+    app: Application, state: Dict[str, Any], viewer_count: Optional[int] = None
+) -> str:
+    tracker = init_tracker_state(app.bot_data)
+    if viewer_count is None:
+        viewer_count = active_viewer_count_global(state)
+    return build_status_text(
+        state,
+        get_snapshot_for_publish(tracker),
+        active_viewer_count=viewer_count,
+        update_interval_seconds=get_update_interval_seconds(viewer_count),
+        running_apps=get_running_apps(tracker),
+        process_list=get_process_list(tracker),
+        plugin_manager=app.bot_data.get("plugins"),
+    )
+
+
 async def update_status_for_chat(
     app: Application,
     chat_id: int,
@@ -61,8 +97,11 @@ async def update_status_for_chat(
     reply_markup=None,
     state: Dict[str, Any] | None = None,
     edit_min_interval: float = 5.0,
-) -> None:
-    logging.info("Chat %s: tick", format_chat_label(chat_id, chat_state))
+) -> bool:
+    if is_status_unchanged(chat_state, text, reply_markup):
+        return False
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Chat %s: tick", format_chat_label(chat_id, chat_state))
     if not chat_state.get("message_id") and _should_pin(chat_state):
         # Will be created by send_or_edit_status_message
         pass
@@ -75,33 +114,47 @@ async def update_status_for_chat(
         state=state,
         edit_min_interval=edit_min_interval,
     )
+    return True
+
+
+async def _gather_chat_updates(
+    targets: list[tuple[int, Dict[str, Any]]], coroutines: list[Coroutine[Any, Any, bool]]
+) -> bool:
+    if not coroutines:
+        return False
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for task_result, (chat_id, chat_state) in zip(results, targets):
+        if isinstance(task_result, Exception):
+            logging.exception(
+                "Chat %s: loop error: %s",
+                format_chat_label(chat_id, chat_state),
+                task_result,
+            )
+    return any(result is True for result in results)
 
 
-async def update_live_status_for_app(app: Application) -> float:
+async def update_live_status_for_app(app: Application) -> Tuple[float, bool]:
     state = app.bot_data.get("state")
     if state is None:
-        return 1.0
+        return 1.0, True
 
-    tracker = init_tracker_state(app.bot_data)
     plugin_manager = app.bot_data.get("plugins")
 
     if int(app.bot_data.get("ui_busy_count", 0)) > 0:
-        logging.info("Live-update skipped (UI priority)")
-        return 1.0
+        logging.debug("Live-update skipped (UI priority)")
+        return 1.0, True
 
     current_date = get_local_date_string()
-    get_view_stats(state, current_date)
+    previous_stats = state.get("view_stats")
+    dirty = get_view_stats(state, current_date) is not previous_stats
     global_active_count = active_viewer_count_global(state)
     update_interval_seconds = get_update_interval_seconds(global_active_count)
     hidden_updates: list[tuple[int, Dict[str, Any]]] = []
     active_updates: list[tuple[int, Dict[str, Any]]] = []
 
-    for chat_id_str, chat_state in state.get("chats", {}).items():
-        if not chat_state.get("enabled"):
-            continue
+    for chat_id_str, chat_state in enabled_chats(state).items():
         chat_id = int(chat_id_str)
-        prune_expired_viewers(chat_state)
-        active = active_viewers(chat_state)
+        active = active_viewer_count(chat_state)
 
         if not active:
             if chat_state.get("status_visible") or chat_state.get("view_mode") != ViewMode.STATUS.value:
@@ -109,112 +162,91 @@ async def update_live_status_for_app(app: Application) -> float:
                 chat_state["view_mode"] = ViewMode.STATUS.value
                 chat_state["viewers"] = {}
                 hidden_updates.append((chat_id, chat_state))
+                dirty = True
             continue
 
-        chat_state["status_visible"] = True
-        _ensure_daily_stats_for_viewers(state, chat_state, current_date)
+        if not chat_state.get("status_visible"):
+            chat_state["status_visible"] = True
+            dirty = True
+        if _ensure_daily_stats_for_viewers(state, chat_state, current_date):
+            dirty = True
         if chat_state.get("callback_in_progress"):
-            logging.info(
-                "Chat %s: live-update skipped (callback in progress)",
-                format_chat_label(chat_id, chat_state),
-            )
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "Chat %s: live-update skipped (callback in progress)",
+                    format_chat_label(chat_id, chat_state),
+                )
             continue
         if chat_state.get("view_mode") != ViewMode.STATUS.value:
-            logging.info(
-                "Chat %s: live-update skipped (view=%s)",
-                format_chat_label(chat_id, chat_state),
-                chat_state.get("view_mode"),
-            )
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "Chat %s: live-update skipped (view=%s)",
+                    format_chat_label(chat_id, chat_state),
+                    chat_state.get("view_mode"),
+                )
             continue
 
         active_updates.append((chat_id, chat_state))
 
-    if hidden_updates:
-        hidden_targets = [
-            (chat_id, chat_state)
-            for chat_id, chat_state in hidden_updates
-            if chat_state.get("view_mode") == ViewMode.STATUS.value
-            and not chat_state.get("callback_in_progress")
-        ]
-        hidden_coroutines = [
-            update_status_for_chat(
-                app,
-                chat_id,
-                chat_state,
-                HIDDEN_STATUS_TEXT,
-                reply_markup=get_status_keyboard(
-                    show_button=True, is_owner=chat_id in OWNER_IDS
-                ),
-                state=state,
-            )
-            for chat_id, chat_state in hidden_targets
-        ]
-        if hidden_coroutines:
-            hidden_results = await asyncio.gather(*hidden_coroutines, return_exceptions=True)
-            for task_result, (chat_id, chat_state) in zip(hidden_results, hidden_targets):
-                if isinstance(task_result, Exception):
-                    logging.exception(
-                        "Chat %s: loop error: %s",
-                        format_chat_label(int(chat_id), chat_state),
-                        task_result,
-                    )
+    targets = [
+        (chat_id, chat_state)
+        for chat_id, chat_state in hidden_updates
+        if chat_state.get("view_mode") == ViewMode.STATUS.value
+        and not chat_state.get("callback_in_progress")
+    ]
+    coroutines = [
+        update_status_for_chat(
+            app,
+            chat_id,
+            chat_state,
+            HIDDEN_STATUS_TEXT,
+            reply_markup=_HIDDEN_KEYBOARDS[chat_id in OWNER_IDS],
+            state=state,
+        )
+        for chat_id, chat_state in targets
+    ]
 
     if active_updates:
-        snapshot = get_snapshot_for_publish(tracker)
-        running_apps = get_running_apps(tracker)
-        process_list = get_process_list(tracker)
         try:
-            text = build_status_text(
-                state,
-                snapshot,
-                active_viewer_count=global_active_count,
-                update_interval_seconds=update_interval_seconds,
-                running_apps=running_apps,
-                process_list=process_list,
-                plugin_manager=plugin_manager,
-            )
+            text = build_live_status_text(app, state, global_active_count)
         except Exception as exc:
             logging.exception("Failed to build status text: %s", exc)
-            text = None
-
-        if text is not None:
-            coroutines = [
+        else:
+            targets.extend(active_updates)
+            coroutines.extend(
                 update_status_for_chat(
                     app,
                     chat_id,
                     chat_state,
                     text,
-                    reply_markup=get_status_keyboard(
-                        show_button=False,
-                        include_hardware=True,
-                        is_owner=chat_id in OWNER_IDS,
-                    ),
+                    reply_markup=_VISIBLE_KEYBOARDS[chat_id in OWNER_IDS],
                     state=state,
                     edit_min_interval=update_interval_seconds,
                 )
                 for chat_id, chat_state in active_updates
-            ]
-            results = await asyncio.gather(*coroutines, return_exceptions=True)
-            for task_result, (chat_id, chat_state) in zip(results, active_updates):
-                if isinstance(task_result, Exception):
-                    logging.exception(
-                        "Chat %s: loop error: %s",
-                        format_chat_label(int(chat_id), chat_state),
-                        task_result,
-                    )
-
-    if plugin_manager:
-        plugin_manager.consume_update_request()
-    await save_state(state)
-    return update_interval_seconds
+            )
+
+    changed = await _gather_chat_updates(targets, coroutines)
+
+    if plugin_manager and plugin_manager.consume_update_request():
+        changed = True
+    if changed or dirty:
+        STATE_SAVER.mark_dirty(state)
+    return update_interval_seconds, changed
 
 
 async def live_update_loop(app: Application) -> None:
     logging.info("Live update loop started")
+    next_tick = time.monotonic()
+    delay = 1.0
     while True:
         try:
-            interval = await update_live_status_for_app(app)
+            interval, changed = await update_live_status_for_app(app)
         except Exception as exc:
             logging.exception("Live update loop error: %s", exc)
-            interval = 1.0
-        await asyncio.sleep(interval)
+            interval, changed = 1.0, True
+        if changed:
+            delay = interval
+        else:
+            delay = min(LIVE_UPDATE_IDLE_MAX_SECONDS, max(interval, delay * LIVE_UPDATE_IDLE_BACKOFF_FACTOR))
+        next_tick = await sleep_until_next_tick(next_tick, delay, "Live update", _LIVE_UPDATE_WAKE)
@@ -1 +1,5 @@
 MAX_EDIT_DELAY = 5.5
+RETRY_AFTER_PADDING_SECONDS = 0.1
+RATE_LIMIT_KEYS_MAX = 4096
+RATE_LIMIT_STALE_SECONDS = 60.0
+SEND_CONCURRENCY = 20
@@ -1,41 +1,74 @@
 import asyncio
+import hashlib
 import logging
 import time
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Tuple
 
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Message
 from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
 from telegram.ext import Application
 
 from system.config import GITHUB_URL
 from system.state import disable_chat, ensure_chat_state, format_chat_label
-from .constants import MAX_EDIT_DELAY
+from .constants import (
+    MAX_EDIT_DELAY,
+    RATE_LIMIT_KEYS_MAX,
+    RATE_LIMIT_STALE_SECONDS,
+    RETRY_AFTER_PADDING_SECONDS,
+    SEND_CONCURRENCY,
+)
 
 
 class RateLimiter:
     def __init__(self) -> None:
-        self._locks: Dict[str, asyncio.Lock] = {}
-        self._last_times: Dict[str, float] = {}
-
-    def _get_lock(self, key: str) -> asyncio.Lock:
-        if key not in self._locks:
-            self._locks[key] = asyncio.Lock()
-        return self._locks[key]
-
-    async def wait(self, action: str, min_interval: float, scope: Optional[str] = None) -> None:
-        key = f"{action}:{scope or 'global'}"
-        lock = self._get_lock(key)
-        async with lock:
-            now = time.monotonic()
-            last = self._last_times.get(key, 0.0)
-            allowed_at = max(last + min_interval, now)
-            self._last_times[key] = allowed_at
+        self._last_times: Dict[Tuple[str, Hashable], float] = {}
+        self._next_prune_at = 0.0
+        self._resume_at = 0.0
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._resume_handle: Optional[asyncio.TimerHandle] = None
+
+    async def wait(self, action: str, min_interval: float, scope: Hashable = None) -> None:
+        key = (action, scope)
+        now = time.monotonic()
+        allowed_at = max(self._last_times.get(key, 0.0) + min_interval, now)
+        self._last_times[key] = allowed_at
+        if len(self._last_times) > RATE_LIMIT_KEYS_MAX and now >= self._next_prune_at:
+            self._prune(now)
         delay = allowed_at - now
         if delay > 0:
             await asyncio.sleep(delay)
+        await self.wait_resumed()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - RATE_LIMIT_STALE_SECONDS
+        self._next_prune_at = now + RATE_LIMIT_STALE_SECONDS
+        for key in [key for key, allowed_at in self._last_times.items() if allowed_at < cutoff]:
+            del self._last_times[key]
+
+    def pause(self, seconds: float) -> None:
+        resume_at = time.monotonic() + seconds
+        if resume_at <= self._resume_at:
+            return
+        self._resume_at = resume_at
+        self._resumed.clear()
+        if self._resume_handle is not None:
+            self._resume_handle.cancel()
+        self._resume_handle = asyncio.get_running_loop().call_later(seconds, self._resumed.set)
+
+    async def wait_resumed(self) -> None:
+        if not self._resumed.is_set():
+            await self._resumed.wait()
 
 
 RATE_LIMITER = RateLimiter()
+_SEND_SEMAPHORE = asyncio.Semaphore(SEND_CONCURRENCY)
+_PENDING_EDITS: Dict[int, Tuple[str, Optional[InlineKeyboardMarkup]]] = {}
+
+
+def _pause_on_retry_after(exc: RetryAfter) -> None:
+    RATE_LIMITER.pause(float(exc.retry_after) + RETRY_AFTER_PADDING_SECONDS)
 
 
 def _bump_edit_delay(chat_state: Dict[str, Any], retry_after: int, chat_id: int) -> None:
@@ -49,8 +82,8 @@ def _bump_edit_delay(chat_state: Dict[str, Any], retry_after: int, chat_id: int)
     )
 
 
-def get_status_keyboard(
-    show_button: bool = True, include_hardware: bool = False, is_owner: bool = False
+def _build_status_keyboard(
+    show_button: bool, include_hardware: bool, is_owner: bool
 ) -> InlineKeyboardMarkup:
     rows = []
     first_row = []
@@ -69,6 +102,23 @@ def get_status_keyboard(
     return InlineKeyboardMarkup(rows)
 
 
+_STATUS_KEYBOARDS = {
+    (show_button, include_hardware, is_owner): _build_status_keyboard(
+        show_button, include_hardware, is_owner
+    )
+    for show_button in (False, True)
+    for include_hardware in (False, True)
+    for is_owner in (False, True)
+}
+
+
+def get_status_keyboard(
+    show_button: bool = True, include_hardware: bool = False, is_owner: bool = False
+) -> InlineKeyboardMarkup:
+    return _STATUS_KEYBOARDS[show_button, include_hardware, is_owner]
+
+
+@lru_cache(maxsize=4)
 def get_viewer_keyboard(include_stats: bool = True) -> InlineKeyboardMarkup:
     rows = [[InlineKeyboardButton(text="🔙 Назад", callback_data="back_to_status")]]
     if include_stats:
@@ -76,6 +126,7 @@ def get_viewer_keyboard(include_stats: bool = True) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(rows)
 
 
+@lru_cache(maxsize=64)
 def get_stats_keyboard(has_prev: bool, has_next: bool, page: int) -> InlineKeyboardMarkup:
     buttons: list[list[InlineKeyboardButton]] = []
     nav_row: list[InlineKeyboardButton] = []
@@ -93,6 +144,7 @@ def get_stats_keyboard(has_prev: bool, has_next: bool, page: int) -> InlineKeybo
     return InlineKeyboardMarkup(buttons)
 
 
+@lru_cache(maxsize=1)
 def get_hardware_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         [[InlineKeyboardButton(text="⬅️ Назад", callback_data="back_to_status")]]
@@ -101,9 +153,18 @@ def get_hardware_keyboard() -> InlineKeyboardMarkup:
 
 async def unpin_all_messages(app: Application, chat_id: int) -> None:
     try:
+        await RATE_LIMITER.wait_resumed()
         await app.bot.unpin_all_chat_messages(chat_id)
         chat_state = ensure_chat_state(app.bot_data.get("state", {}), chat_id)
         logging.info("Chat %s: unpinned all messages", format_chat_label(chat_id, chat_state))
+    except RetryAfter as exc:
+        _pause_on_retry_after(exc)
+        chat_state = ensure_chat_state(app.bot_data.get("state", {}), chat_id)
+        logging.warning(
+            "Chat %s: retry after on unpin: %s",
+            format_chat_label(chat_id, chat_state),
+            exc.retry_after,
+        )
     except TelegramError as exc:
         chat_state = ensure_chat_state(app.bot_data.get("state", {}), chat_id)
         logging.warning(
@@ -129,9 +190,14 @@ async def unpin_status_message(
     if not message_id:
         return
     try:
+        await RATE_LIMITER.wait_resumed()
         await app.bot.unpin_chat_message(chat_id=chat_id, message_id=message_id)
         label = format_chat_label(chat_id, chat_state) if chat_state else str(chat_id)
         logging.info("Chat %s: unpinned old status message %s", label, message_id)
+    except RetryAfter as exc:
+        _pause_on_retry_after(exc)
+        label = format_chat_label(chat_id, chat_state) if chat_state else str(chat_id)
+        logging.warning("Chat %s: retry after on unpin: %s", label, exc.retry_after)
     except TelegramError as exc:
         label = format_chat_label(chat_id, chat_state) if chat_state else str(chat_id)
         logging.warning("Chat %s: failed to unpin message %s: %s", label, message_id, exc)
@@ -145,9 +211,10 @@ async def send_restart_notice(
     app: Application, chat_id: int, chat_state: Optional[Dict[str, Any]] = None
 ) -> None:
     try:
-        await RATE_LIMITER.wait("send", 2.0, scope=str(chat_id))
+        await RATE_LIMITER.wait("send", 2.0, scope=chat_id)
         await app.bot.send_message(chat_id=chat_id, text="♻️ Бот был перезагружен.\nby vlal")
     except RetryAfter as exc:
+        _pause_on_retry_after(exc)
         label = format_chat_label(chat_id, chat_state) if chat_state else str(chat_id)
         logging.warning("Chat %s: retry after on restart notice: %s", label, exc.retry_after)
     except TelegramError as exc:
@@ -181,34 +248,22 @@ async def startup_reset_chat_session(
     )
 
 
-async def send_and_pin_status_message(
+async def _send_message(
     app: Application,
     chat_id: int,
     chat_state: Dict[str, Any],
     text: str,
-    reply_markup: Optional[InlineKeyboardMarkup] = None,
-    pin: bool = True,
-    state: Optional[Dict[str, Any]] = None,
-) -> None:
+    reply_markup: Optional[InlineKeyboardMarkup],
+    state: Optional[Dict[str, Any]],
+) -> Optional[Message]:
     try:
-        await RATE_LIMITER.wait("send", 2.0, scope=str(chat_id))
-        message = await app.bot.send_message(
-            chat_id=chat_id, text=text, reply_markup=reply_markup
-        )
-        chat_state["message_id"] = message.message_id
-        chat_state["last_sent_text"] = None
-        should_pin = pin and chat_state.get("chat_type") in {"private", "group", "supergroup"}
-        if should_pin:
-            try:
-                await app.bot.pin_chat_message(chat_id=chat_id, message_id=message.message_id)
-            except TelegramError as exc:
-                logging.warning("Failed to pin message in chat %s: %s", chat_id, exc)
-        logging.info(
-            "Chat %s: recreated message %s",
-            format_chat_label(chat_id, chat_state),
-            message.message_id,
-        )
+        await RATE_LIMITER.wait("send", 2.0, scope=chat_id)
+        async with _SEND_SEMAPHORE:
+            return await app.bot.send_message(
+                chat_id=chat_id, text=text, reply_markup=reply_markup
+            )
     except RetryAfter as exc:
+        _pause_on_retry_after(exc)
         logging.warning(
             "Chat %s: retry after on send: %s",
             format_chat_label(chat_id, chat_state),
@@ -233,6 +288,62 @@ async def send_and_pin_status_message(
             format_chat_label(chat_id, chat_state),
             exc,
         )
+    return None
+
+
+async def send_and_pin_status_message(
+    app: Application,
+    chat_id: int,
+    chat_state: Dict[str, Any],
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    pin: bool = True,
+    state: Optional[Dict[str, Any]] = None,
+) -> None:
+    message = await _send_message(app, chat_id, chat_state, text, reply_markup, state)
+    if message is None:
+        return
+    chat_state["message_id"] = message.message_id
+    chat_state["last_sent_hash"] = None
+    should_pin = pin and chat_state.get("chat_type") in {"private", "group", "supergroup"}
+    if should_pin:
+        try:
+            await RATE_LIMITER.wait_resumed()
+            await app.bot.pin_chat_message(chat_id=chat_id, message_id=message.message_id)
+        except RetryAfter as exc:
+            _pause_on_retry_after(exc)
+            logging.warning(
+                "Chat %s: retry after on pin: %s",
+                format_chat_label(chat_id, chat_state),
+                exc.retry_after,
+            )
+        except TelegramError as exc:
+            logging.warning("Failed to pin message in chat %s: %s", chat_id, exc)
+    logging.info(
+        "Chat %s: recreated message %s",
+        format_chat_label(chat_id, chat_state),
+        message.message_id,
+    )
+
+
+@lru_cache(maxsize=64)
+def _text_signature(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@lru_cache(maxsize=32)
+def _markup_signature(reply_markup: Optional[InlineKeyboardMarkup]) -> Optional[int]:
+    return _text_signature(reply_markup.to_json()) if reply_markup is not None else None
+
+
+def is_status_unchanged(
+    chat_state: Dict[str, Any], text: str, reply_markup: Optional[InlineKeyboardMarkup] = None
+) -> bool:
+    return bool(
+        chat_state.get("message_id")
+        and chat_state.get("last_sent_hash") == _text_signature(text)
+        and chat_state.get("last_sent_markup") == _markup_signature(reply_markup)
+    )
 
 
 async def send_or_edit_status_message(
@@ -246,13 +357,16 @@ async def send_or_edit_status_message(
     skip_rate_limit: bool = False,
     edit_min_interval: float = 5.0,
 ) -> None:
-    lock = _get_chat_lock(chat_id)
-    async with lock:
-        snapshot_message_id = chat_state.get("message_id")
-        snapshot_last_text = chat_state.get("last_sent_text")
-
-    if snapshot_message_id and snapshot_last_text == text:
-        logging.info("Chat %s: skip unchanged", format_chat_label(chat_id, chat_state))
+    text_sig = _text_signature(text)
+    markup_sig = _markup_signature(reply_markup)
+    snapshot_message_id = chat_state.get("message_id")
+    if (
+        snapshot_message_id
+        and chat_state.get("last_sent_hash") == text_sig
+        and chat_state.get("last_sent_markup") == markup_sig
+    ):
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Chat %s: skip unchanged", format_chat_label(chat_id, chat_state))
         return
 
     if not snapshot_message_id:
@@ -267,59 +381,85 @@ async def send_or_edit_status_message(
         return
 
     if not skip_rate_limit:
+        if chat_id in _PENDING_EDITS:
+            _PENDING_EDITS[chat_id] = (text, reply_markup)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    "Chat %s: coalesced into pending edit", format_chat_label(chat_id, chat_state)
+                )
+            return
+        _PENDING_EDITS[chat_id] = (text, reply_markup)
         effective_interval = max(edit_min_interval, float(chat_state.get("edit_delay", 0.0) or 0.0))
         effective_interval = min(max(effective_interval, edit_min_interval), MAX_EDIT_DELAY)
-        await RATE_LIMITER.wait("edit", effective_interval, scope=str(chat_id))
+        try:
+            await RATE_LIMITER.wait("edit", effective_interval, scope=chat_id)
+        finally:
+            text, reply_markup = _PENDING_EDITS.pop(chat_id)
+        text_sig = _text_signature(text)
+        markup_sig = _markup_signature(reply_markup)
+    else:
+        await RATE_LIMITER.wait_resumed()
 
     need_send_instead = False
-    async with lock:
-        message_id = chat_state.get("message_id")
-        if not message_id:
-            need_send_instead = True
-        elif chat_state.get("last_sent_text") == text:
-            logging.info("Chat %s: skip unchanged", format_chat_label(chat_id, chat_state))
-            return
-        else:
-            try:
+    message_id = chat_state.get("message_id")
+    if not message_id:
+        need_send_instead = True
+    elif (
+        chat_state.get("last_sent_hash") == text_sig
+        and chat_state.get("last_sent_markup") == markup_sig
+    ):
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Chat %s: skip unchanged", format_chat_label(chat_id, chat_state))
+        return
+    else:
+        try:
+            async with _SEND_SEMAPHORE:
                 await app.bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=message_id,
                     text=text,
                     reply_markup=reply_markup,
                 )
-                chat_state["last_sent_text"] = text
-                current_delay = float(chat_state.get("edit_delay", 0.0) or 0.0)
-                if current_delay > edit_min_interval:
-                    chat_state["edit_delay"] = min(
-                        max(edit_min_interval, current_delay - 0.5), MAX_EDIT_DELAY
-                    )
-                logging.info("Chat %s: edited ok", format_chat_label(chat_id, chat_state))
-                return
-            except RetryAfter as exc:
-                _bump_edit_delay(chat_state, exc.retry_after, chat_id)
-                return
-            except (Forbidden, BadRequest) as exc:
-                logging.warning(
-                    "Chat %s: unrecoverable edit error: %s",
-                    format_chat_label(chat_id, chat_state),
-                    exc,
+            chat_state["last_sent_hash"] = text_sig
+            chat_state["last_sent_markup"] = markup_sig
+            current_delay = float(chat_state.get("edit_delay", 0.0) or 0.0)
+            if current_delay > edit_min_interval:
+                chat_state["edit_delay"] = min(
+                    max(edit_min_interval, current_delay - 0.5), MAX_EDIT_DELAY
                 )
-                disable_chat(state, chat_id)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Chat %s: edited ok", format_chat_label(chat_id, chat_state))
+            return
+        except RetryAfter as exc:
+            _pause_on_retry_after(exc)
+            _bump_edit_delay(chat_state, exc.retry_after, chat_id)
+            return
+        except (Forbidden, BadRequest) as exc:
+            if isinstance(exc, BadRequest) and "message is not modified" in str(exc).lower():
+                chat_state["last_sent_hash"] = text_sig
+                chat_state["last_sent_markup"] = markup_sig
                 return
-            except TelegramError as exc:
-                logging.exception(
-                    "Chat %s: edit failed (%s), recreating",
-                    format_chat_label(chat_id, chat_state),
-                    exc,
-                )
-                need_send_instead = True
-            except Exception as exc:
-                logging.exception(
-                    "Chat %s: unexpected edit error: %s",
-                    format_chat_label(chat_id, chat_state),
-                    exc,
-                )
-                need_send_instead = True
+            logging.warning(
+                "Chat %s: unrecoverable edit error: %s",
+                format_chat_label(chat_id, chat_state),
+                exc,
+            )
+            disable_chat(state, chat_id)
+            return
+        except TelegramError as exc:
+            logging.exception(
+                "Chat %s: edit failed (%s), recreating",
+                format_chat_label(chat_id, chat_state),
+                exc,
+            )
+            need_send_instead = True
+        except Exception as exc:
+            logging.exception(
+                "Chat %s: unexpected edit error: %s",
+                format_chat_label(chat_id, chat_state),
+                exc,
+            )
+            need_send_instead = True
 
     if need_send_instead:
         await send_and_pin_status_message(
@@ -335,44 +475,5 @@ async def send_status_reply_message(
     reply_markup: Optional[InlineKeyboardMarkup] = None,
     state: Optional[Dict[str, Any]] = None,
 ) -> Optional[int]:
-    try:
-        await RATE_LIMITER.wait("send", 2.0, scope=str(chat_id))
-        message = await app.bot.send_message(
-            chat_id=chat_id, text=text, reply_markup=reply_markup
-        )
-        return message.message_id
-    except RetryAfter as exc:
-        logging.warning(
-            "Chat %s: retry after on send: %s",
-            format_chat_label(chat_id, chat_state),
-            exc.retry_after,
-        )
-    except (Forbidden, BadRequest) as exc:
-        logging.warning(
-            "Chat %s: unrecoverable send error: %s",
-            format_chat_label(chat_id, chat_state),
-            exc,
-        )
-        disable_chat(state, chat_id)
-    except TelegramError as exc:
-        logging.exception(
-            "Telegram error for chat %s on send: %s",
-            format_chat_label(chat_id, chat_state),
-            exc,
-        )
-    except Exception as exc:
-        logging.exception(
-            "Unexpected error for chat %s on send: %s",
-            format_chat_label(chat_id, chat_state),
-            exc,
-        )
-    return None
-
-
-_CHAT_LOCKS: Dict[int, asyncio.Lock] = {}
-
-
-def _get_chat_lock(chat_id: int) -> asyncio.Lock:
-    if chat_id not in _CHAT_LOCKS:
-        _CHAT_LOCKS[chat_id] = asyncio.Lock()
-    return _CHAT_LOCKS[chat_id]
+    message = await _send_message(app, chat_id, chat_state, text, reply_markup, state)
+    return message.message_id if message is not None else None
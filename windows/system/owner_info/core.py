@@ -25,7 +25,7 @@ class OwnerInfoManager:
     ) -> None:
         try:
             await asyncio.sleep(20)
-            await RATE_LIMITER.wait("delete", 2.0, scope=str(chat_id))
+            await RATE_LIMITER.wait("delete", 2.0, scope=chat_id)
             await app.bot.delete_message(chat_id=chat_id, message_id=message_id)
         except TelegramError as exc:
             logging.warning(
@@ -1,14 +1,21 @@
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import psutil
 import win32api
 import win32gui
 import win32process
 
-PROCESS_COUNT_REFRESH_SECONDS = 10
+PROCESS_COUNT_REFRESH_SECONDS = 30
+ACTIVE_PROCESS_CACHE_SIZE = 32
+FOREGROUND_CACHE_SECONDS = 2.0
+_BOOT_TIME = psutil.boot_time()
+_ACTIVE_PROCESS_CACHE: "OrderedDict[int, Tuple[psutil.Process, str, float]]" = OrderedDict()
+_FOREGROUND_CACHE: Dict[str, Any] = {"hwnd": 0, "pid": None, "name": None, "create_time": None, "stamp": 0.0}
 
 
 @dataclass
@@ -47,20 +54,42 @@ def get_window_title_for_pid(pid: int) -> Optional[str]:
 
 
 def get_system_uptime_seconds() -> float:
-    boot_time = datetime.fromtimestamp(psutil.boot_time())
-    return (datetime.now() - boot_time).total_seconds()
+    return time.time() - _BOOT_TIME
+
+
+_LOCAL_TIME_CACHE = (0, "")
+_LOCAL_DATE_CACHE = (0, "")
 
 
 def get_local_time_string() -> str:
-    return datetime.now().strftime("%H:%M:%S")
+    global _LOCAL_TIME_CACHE
+    now = int(time.time())
+    cached_at, cached = _LOCAL_TIME_CACHE
+    if cached_at == now:
+        return cached
+    value = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+    _LOCAL_TIME_CACHE = (now, value)
+    return value
 
 
 def get_local_date_string() -> str:
-    return datetime.now().strftime("%Y-%m-%d")
+    global _LOCAL_DATE_CACHE
+    now = int(time.time())
+    cached_at, cached = _LOCAL_DATE_CACHE
+    if cached_at == now:
+        return cached
+    date = datetime.fromtimestamp(now).strftime("%Y-%m-%d")
+    _LOCAL_DATE_CACHE = (now, date)
+    return date
 
 
 def format_local_hhmm(timestamp: float) -> str:
-    return datetime.fromtimestamp(timestamp).strftime("%H:%M")
+    return _format_local_minute(int(timestamp) // 60)
+
+
+@lru_cache(maxsize=256)
+def _format_local_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime("%H:%M")
 
 
 def get_last_input_idle_seconds() -> Optional[float]:
@@ -75,20 +104,45 @@ def get_last_input_idle_seconds() -> Optional[float]:
         return None
 
 
+def _active_process_identity(pid: int) -> Tuple[str, float]:
+    cached = _ACTIVE_PROCESS_CACHE.get(pid)
+    if cached is not None:
+        proc, name, create_time = cached
+        if proc.is_running():
+            _ACTIVE_PROCESS_CACHE.move_to_end(pid)
+            return name, create_time
+        del _ACTIVE_PROCESS_CACHE[pid]
+    proc = psutil.Process(pid)
+    with proc.oneshot():
+        name = proc.name()
+        create_time = proc.create_time()
+    _ACTIVE_PROCESS_CACHE[pid] = (proc, name, create_time)
+    if len(_ACTIVE_PROCESS_CACHE) > ACTIVE_PROCESS_CACHE_SIZE:
+        _ACTIVE_PROCESS_CACHE.popitem(last=False)
+    return name, create_time
+
+
 def get_active_process_info() -> Dict[str, Any]:
     try:
         hwnd = win32gui.GetForegroundWindow()
         if not hwnd:
             return {"name": "Unknown", "pid": None, "create_time": None, "title": None}
-        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-        if not pid:
-            return {"name": "Unknown", "pid": None, "create_time": None, "title": None}
-        proc = psutil.Process(pid)
+        now = time.monotonic()
+        if hwnd == _FOREGROUND_CACHE["hwnd"] and now - _FOREGROUND_CACHE["stamp"] < FOREGROUND_CACHE_SECONDS:
+            pid = _FOREGROUND_CACHE["pid"]
+            name = _FOREGROUND_CACHE["name"]
+            create_time = _FOREGROUND_CACHE["create_time"]
+        else:
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            if not pid:
+                return {"name": "Unknown", "pid": None, "create_time": None, "title": None}
+            name, create_time = _active_process_identity(pid)
+            _FOREGROUND_CACHE.update(hwnd=hwnd, pid=pid, name=name, create_time=create_time, stamp=now)
         title = win32gui.GetWindowText(hwnd) or None
         return {
-            "name": proc.name(),
+            "name": name,
             "pid": pid,
-            "create_time": proc.create_time(),
+            "create_time": create_time,
             "title": title,
         }
     except Exception:
@@ -102,7 +156,7 @@ def get_process_uptime_seconds(create_time: Optional[float]) -> Optional[float]:
 
 
 def get_process_count() -> Optional[int]:
-    now = time.time()
+    now = time.monotonic()
     if now - process_count_cache.updated_at >= PROCESS_COUNT_REFRESH_SECONDS:
         try:
             process_count_cache.count = len(psutil.pids())
@@ -1,7 +1,30 @@
+import asyncio
+import logging
 import time
+from typing import Optional
 
-from system.config import BOT_START_TIME
+from system.config import BOT_START_MONOTONIC
 
 
 def get_bot_uptime_seconds() -> float:
-    return max(0.0, time.time() - BOT_START_TIME)
+    return max(0.0, time.monotonic() - BOT_START_MONOTONIC)
+
+
+async def sleep_until_next_tick(
+    next_tick: float, interval: float, label: str, wake: Optional[asyncio.Event] = None
+) -> float:
+    next_tick += interval
+    now = time.monotonic()
+    if now - next_tick > 2 * interval:
+        logging.warning("%s loop fell behind by %.2fs, resyncing", label, now - next_tick)
+        next_tick = now
+    delay = max(0.0, next_tick - now)
+    if wake is None:
+        await asyncio.sleep(delay)
+        return next_tick
+    try:
+        await asyncio.wait_for(wake.wait(), delay)
+    except asyncio.TimeoutError:
+        return next_tick
+    wake.clear()
+    return time.monotonic()
@@ -1 +1,3 @@
 """Module constants for internal system component."""
+STATE_SAVE_DELAY_SECONDS = 0.25
+STATE_SAVE_MIN_INTERVAL_SECONDS = 5.0
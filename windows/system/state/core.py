@@ -1,13 +1,25 @@
 import asyncio
+import bisect
+import heapq
+import itertools
 import json
 import logging
+import os
 import time
+import weakref
+from dataclasses import asdict, dataclass
 from datetime import date
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from system.platform import get_local_date_string
+from .constants import STATE_SAVE_DELAY_SECONDS, STATE_SAVE_MIN_INTERVAL_SECONDS
 
 
 class ViewMode(str, Enum):
@@ -16,9 +28,43 @@ class ViewMode(str, Enum):
     VIEWERS = "viewers"
     STATS = "stats"
 
+
+@dataclass(slots=True)
+class ViewerEntry:
+    view_start: float
+    view_expire: float
+    username: Optional[str] = None
+    name: Optional[str] = None
+    stats_date: Optional[str] = None
+
+
+class ChatState(TypedDict, total=False):
+    enabled: bool
+    chat_type: Optional[str]
+    chat_username: Optional[str]
+    chat_name: Optional[str]
+    message_id: Optional[int]
+    last_sent_hash: Optional[int]
+    last_sent_markup: Optional[int]
+    edit_delay: float
+    backoff_until: Optional[float]
+    last_user_reply_ns: Optional[int]
+    last_button_ts: Dict[str, float]
+    viewers: Dict[str, ViewerEntry]
+    status_visible: bool
+    view_mode: str
+    stats_page: int
+    callback_in_progress: bool
+    _viewers_heap: List[Tuple[float, str]]
+
+
 STATE_FILE = Path(__file__).resolve().parents[2] / "state.json"
 STATS_DIR = STATE_FILE.parent
 STATE_LOCK = asyncio.Lock()
+_CHAT_LOCKS: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+StatsRow = Tuple[int, float, str, Optional[str], Optional[str]]
+_STATS_INDEX: Dict[str, Any] = {"users": None, "rows": []}
+_STATS_VERSIONS = itertools.count(1)
 
 
 def _stats_filename_for_date(current_date: str) -> Path:
@@ -40,6 +86,12 @@ def _cleanup_old_stats_files(current_date: str) -> None:
                 logging.warning("Failed to delete old stats file %s", path)
 
 
+def _decode_json(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_daily_stats(current_date: str) -> Dict[str, Any]:
     _cleanup_old_stats_files(current_date)
     stats_file = _stats_filename_for_date(current_date)
@@ -47,8 +99,7 @@ def load_daily_stats(current_date: str) -> Dict[str, Any]:
         logging.info("Loaded daily stats file: %s (new)", stats_file.name)
         return {"date": current_date, "users": {}}
     try:
-        with stats_file.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = _decode_json(stats_file.read_bytes())
         if data.get("date") != current_date:
             logging.info("Daily stats date mismatch, resetting stats")
             return {"date": current_date, "users": {}}
@@ -69,31 +120,116 @@ def save_daily_stats(stats: Dict[str, Any]) -> None:
         logging.exception("Unable to save daily stats to %s", stats_file)
 
 
+def _viewer_entry(info: Any) -> ViewerEntry:
+    if isinstance(info, ViewerEntry):
+        return info
+    return ViewerEntry(
+        float(info.get("view_start") or 0),
+        float(info.get("view_expire") or 0),
+        info.get("username"),
+        info.get("name"),
+        info.get("stats_date"),
+    )
+
+
 def load_state(current_date: str | None = None) -> Dict[str, Any]:
     current_date = current_date or get_local_date_string()
     base = {"chats": {}, "apps": {}, "view_stats": load_daily_stats(current_date)}
     if not STATE_FILE.exists():
         return base
     try:
-        with STATE_FILE.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = _decode_json(STATE_FILE.read_bytes())
         if "chats" not in data:
             data["chats"] = {}
         if "apps" not in data:
             data["apps"] = {}
+        for chat_state in data["chats"].values():
+            viewers = chat_state.get("viewers") or {}
+            chat_state["viewers"] = {uid: _viewer_entry(info) for uid, info in viewers.items()}
+            chat_state["backoff_until"] = None
+            chat_state["last_user_reply_ns"] = None
+            chat_state["last_button_ts"] = {}
+            chat_state["callback_in_progress"] = False
+            chat_state.pop("last_sent_text", None)
         data["view_stats"] = load_daily_stats(current_date)
         return data
     except (OSError, json.JSONDecodeError):
         return base
 
 
+def _persistable_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {key: value for key, value in state.items() if not key.startswith("_")}
+    chats = payload.get("chats")
+    if chats:
+        payload["chats"] = {
+            chat_id: {key: value for key, value in chat_state.items() if not key.startswith("_")}
+            for chat_id, chat_state in chats.items()
+        }
+    return payload
+
+
+def _encode_state(state: Dict[str, Any]) -> bytes:
+    payload = _persistable_state(state)
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False, indent=2, default=asdict).encode("utf-8")
+
+
+def _write_state_file(data: bytes) -> None:
+    tmp_path = STATE_FILE.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, STATE_FILE)
+
+
 async def save_state(state: Dict[str, Any]) -> None:
+    data = _encode_state(state)
     async with STATE_LOCK:
-        with STATE_FILE.open("w", encoding="utf-8") as handle:
-            json.dump(state, handle, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(_write_state_file, data)
+
+
+class StateSaver:
+    def __init__(self) -> None:
+        self._dirty = asyncio.Event()
+        self._state: Dict[str, Any] | None = None
+        self._pending = False
+        self._last_flush = 0.0
+
+    def mark_dirty(self, state: Dict[str, Any]) -> None:
+        self._state = state
+        self._pending = True
+        self._dirty.set()
+
+    async def flush(self) -> None:
+        if not self._pending or self._state is None:
+            return
+        self._pending = False
+        self._dirty.clear()
+        self._last_flush = time.monotonic()
+        try:
+            await save_state(self._state)
+        except Exception:
+            logging.exception("Failed to save state")
+
+    async def run(self) -> None:
+        while True:
+            await self._dirty.wait()
+            next_allowed = self._last_flush + STATE_SAVE_MIN_INTERVAL_SECONDS - time.monotonic()
+            await asyncio.sleep(max(STATE_SAVE_DELAY_SECONDS, next_allowed))
+            await self.flush()
+
 
+STATE_SAVER = StateSaver()
 
-def ensure_chat_state(state: Dict[str, Any], chat_id: int) -> Dict[str, Any]:
+
+def get_chat_lock(chat_id: int) -> asyncio.Lock:
+    lock = _CHAT_LOCKS.get(chat_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _CHAT_LOCKS[chat_id] = lock
+    return lock
+
+
+def ensure_chat_state(state: Dict[str, Any], chat_id: int) -> ChatState:
     chats = state.setdefault("chats", {})
     chat_state = chats.setdefault(
         str(chat_id),
@@ -103,9 +239,9 @@ def ensure_chat_state(state: Dict[str, Any], chat_id: int) -> Dict[str, Any]:
             "chat_username": None,
             "chat_name": None,
             "message_id": None,
-            "last_sent_text": None,
+            "last_sent_hash": None,
             "backoff_until": None,
-            "last_user_reply_ts": None,
+            "last_user_reply_ns": None,
             "last_button_ts": {},
             "viewers": {},
             "status_visible": False,
@@ -135,65 +271,99 @@ def format_chat_label(chat_id: int, chat_state: Dict[str, Any]) -> str:
     return str(chat_id)
 
 
+def enabled_chats(state: Dict[str, Any]) -> Dict[str, ChatState]:
+    index = state.get("_enabled_chats")
+    if index is None:
+        index = {
+            chat_id: chat_state
+            for chat_id, chat_state in state.get("chats", {}).items()
+            if chat_state.get("enabled")
+        }
+        state["_enabled_chats"] = index
+    return index
+
+
+def enable_chat(state: Dict[str, Any], chat_id: int) -> ChatState:
+    chat_state = ensure_chat_state(state, chat_id)
+    chat_state["enabled"] = True
+    enabled_chats(state)[str(chat_id)] = chat_state
+    return chat_state
+
+
 def disable_chat(state: Dict[str, Any] | None, chat_id: int) -> None:
     if state is None:
         return
     chat_state = ensure_chat_state(state, chat_id)
     chat_state["enabled"] = False
+    enabled_chats(state).pop(str(chat_id), None)
     chat_state["viewers"] = {}
     chat_state["status_visible"] = False
     chat_state["view_mode"] = ViewMode.STATUS.value
     chat_state["message_id"] = None
-    chat_state["last_sent_text"] = None
+    chat_state["last_sent_hash"] = None
     chat_state["backoff_until"] = None
     stats = state.get("view_stats") if state else None
-    if stats:
-        stats.get("users", {}).pop(str(chat_id), None)
+    if stats and stats.get("users", {}).pop(str(chat_id), None) is not None:
+        _STATS_INDEX["users"] = None
+        bump_stats_version(stats)
 
 
-def active_viewers(chat_state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def active_viewers(chat_state: Dict[str, Any]) -> Dict[str, ViewerEntry]:
     viewers = chat_state.get("viewers") or {}
     now = time.time()
-    return {
-        uid: info
-        for uid, info in viewers.items()
-        if info.get("view_expire") and info["view_expire"] > now
-    }
+    return {uid: info for uid, info in viewers.items() if info.view_expire > now}
+
+
+def active_viewer_count(chat_state: Dict[str, Any]) -> int:
+    prune_expired_viewers(chat_state)
+    return len(chat_state["viewers"])
 
 
 def active_viewer_count_global(state: Dict[str, Any]) -> int:
     viewer_ids = set()
-    now = time.time()
-    for chat_state in state.get("chats", {}).values():
+    for chat_state in enabled_chats(state).values():
         prune_expired_viewers(chat_state)
-        viewers = chat_state.get("viewers") or {}
-        for uid, info in viewers.items():
-            if info.get("view_expire") and info["view_expire"] > now:
-                viewer_ids.add(uid)
+        viewer_ids.update(chat_state["viewers"])
     return len(viewer_ids)
 
 
 def active_viewer_details_global(state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     details: Dict[str, Dict[str, Any]] = {}
     now = time.time()
-    for chat_state in state.get("chats", {}).values():
+    for chat_state in enabled_chats(state).values():
         prune_expired_viewers(chat_state)
         viewers = chat_state.get("viewers") or {}
         for uid, info in viewers.items():
-            if info.get("view_expire") and info["view_expire"] > now:
-                details[uid] = {
-                    "username": info.get("username"),
-                    "name": info.get("name"),
-                }
+            if info.view_expire > now:
+                details[uid] = {"username": info.username, "name": info.name}
     return details
 
 
+def _get_viewers_heap(chat_state: Dict[str, Any]) -> List[Tuple[float, str]]:
+    heap = chat_state.get("_viewers_heap")
+    if heap is None:
+        viewers = chat_state.get("viewers") or {}
+        heap = [(info.view_expire, uid) for uid, info in viewers.items()]
+        heapq.heapify(heap)
+        chat_state["_viewers_heap"] = heap
+    return heap
+
+
+def add_viewer(chat_state: Dict[str, Any], uid: str, info: ViewerEntry) -> None:
+    heap = _get_viewers_heap(chat_state)
+    chat_state.setdefault("viewers", {})[uid] = info
+    heapq.heappush(heap, (info.view_expire, uid))
+
+
 def prune_expired_viewers(chat_state: Dict[str, Any]) -> None:
     viewers = chat_state.get("viewers") or {}
+    heap = _get_viewers_heap(chat_state)
     now = time.time()
-    to_remove = [uid for uid, info in viewers.items() if not info.get("view_expire") or info["view_expire"] <= now]
-    for uid in to_remove:
-        viewers.pop(uid, None)
+    while heap and heap[0][0] <= now:
+        _, uid = heapq.heappop(heap)
+        info = viewers.get(uid)
+        if info is not None and info.view_expire <= now:
+            del viewers[uid]
     chat_state["viewers"] = viewers
 
 
@@ -218,6 +388,46 @@ def ensure_view_stats(state: Dict[str, Any], current_date: str) -> Dict[str, Any
     return stats
 
 
+def _stats_row(key: str, entry: Dict[str, Any]) -> StatsRow:
+    return (
+        -int(entry.get("count", 0) or 0),
+        -(entry.get("last_view") or 0),
+        key,
+        entry.get("username"),
+        entry.get("name"),
+    )
+
+
+def _remove_stats_row(index: List[StatsRow], row: StatsRow) -> None:
+    pos = bisect.bisect_left(index, row)
+    if pos < len(index) and index[pos] == row:
+        del index[pos]
+    else:
+        _STATS_INDEX["users"] = None
+
+
+def bump_stats_version(stats: Dict[str, Any]) -> int:
+    stats["version"] = next(_STATS_VERSIONS)
+    return stats["version"]
+
+
+def get_stats_version(stats: Dict[str, Any]) -> int:
+    version = stats.get("version")
+    if version is None:
+        return bump_stats_version(stats)
+    return version
+
+
+def sorted_stats_index(stats: Dict[str, Any]) -> List[StatsRow]:
+    users = stats.setdefault("users", {})
+    rows = _STATS_INDEX["rows"]
+    if _STATS_INDEX["users"] is not users or len(rows) != len(users):
+        rows = sorted(_stats_row(key, entry) for key, entry in users.items())
+        _STATS_INDEX["users"] = users
+        _STATS_INDEX["rows"] = rows
+    return rows
+
+
 def record_view_event(
     state: Dict[str, Any],
     current_date: str,
@@ -228,14 +438,20 @@ def record_view_event(
 ) -> None:
     stats = ensure_view_stats(state, current_date)
     users = stats.setdefault("users", {})
-    entry = users.setdefault(
-        str(user_id),
-        {"username": username, "name": name, "count": 0, "last_view": timestamp},
-    )
+    index = sorted_stats_index(stats)
+    key = str(user_id)
+    entry = users.get(key)
+    if entry is None:
+        entry = {"username": username, "name": name, "count": 0, "last_view": timestamp}
+        users[key] = entry
+    else:
+        _remove_stats_row(index, _stats_row(key, entry))
     entry["username"] = username or entry.get("username")
     entry["name"] = name or entry.get("name")
     entry["count"] = int(entry.get("count", 0)) + 1
     entry["last_view"] = timestamp
+    bisect.insort(index, _stats_row(key, entry))
+    bump_stats_version(stats)
     save_daily_stats(stats)
 
 
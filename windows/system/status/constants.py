@@ -15,6 +15,7 @@ BROWSER_PROCESS_NAMES = {
     "opera_gx.exe",
 }
 
+JAVA_PROCESS_NAMES = frozenset({"java.exe", "javaw.exe"})
 PROCESS_ALIASES: Dict[str, str] = {
     **{name: "browser" for name in BROWSER_PROCESS_NAMES},
     "code.exe": "vscode",
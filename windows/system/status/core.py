@@ -1,6 +1,7 @@
 import os
 import time
 from datetime import timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from system.presence import PRESENCE_THRESHOLD_SECONDS, PRESENCE_TRACKER, presence_duration_seconds
@@ -20,18 +21,25 @@ from .constants import (
     FAVORITE_APPS,
     FOOTER_TEXT,
     HIDDEN_STATUS_TEXT,
+    JAVA_PROCESS_NAMES,
     JS_PROCESS_NAMES,
     PROCESS_ALIASES,
     PYTHON_PROCESS_NAMES,
     TAGLINES,
 )
 
+_STATUS_TEXT_CACHE: Dict[str, Any] = {"key": None, "text": ""}
 
-def format_duration(seconds: float) -> str:
-    seconds = max(0, int(seconds))
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
     return str(timedelta(seconds=seconds))
 
 
+def format_duration(seconds: float) -> str:
+    return _format_whole_seconds(max(0, int(seconds)))
+
+
 def _format_presence_duration(seconds: float, with_suffix: bool = False) -> str:
     seconds = max(0, int(seconds))
     if seconds < 60:
@@ -46,6 +54,7 @@ def _format_presence_duration(seconds: float, with_suffix: bool = False) -> str:
     return f"{hours} ч" + (" назад" if with_suffix else "")
 
 
+@lru_cache(maxsize=1024)
 def resolve_app_key(process_name: Optional[str]) -> str:
     if not process_name:
         return "unknown"
@@ -53,6 +62,7 @@ def resolve_app_key(process_name: Optional[str]) -> str:
     return PROCESS_ALIASES.get(normalized, "unknown")
 
 
+@lru_cache(maxsize=1024)
 def resolve_display_name(app_key: str, process_name: Optional[str], title: Optional[str] = None) -> str:
     if app_key == "minecraft" and title:
         return title
@@ -69,6 +79,11 @@ def resolve_tagline(app_key: str) -> str:
     return TAGLINES.get(app_key, TAGLINES["default"])
 
 
+@lru_cache(maxsize=256)
+def _active_app_lines(display_name: str, tagline: str) -> Tuple[str, str]:
+    return f"🪟 Активное приложение: {display_name}", f"💬 Приписка: {tagline}"
+
+
 def _detect_minecraft_display(process_info: Dict[str, Any]) -> Optional[str]:
     pid = process_info.get("pid")
     if pid is None:
@@ -84,7 +99,7 @@ def _detect_app_key(process_info: Dict[str, Any]) -> (str, Optional[str]):
     if not name:
         return "unknown", None
     lower_name = name.lower()
-    if lower_name in {"java.exe", "javaw.exe"}:
+    if lower_name in JAVA_PROCESS_NAMES:
         title = _detect_minecraft_display(process_info)
         if title:
             return "minecraft", title
@@ -101,11 +116,11 @@ def _collect_running_apps(processes: Optional[List[Dict[str, Any]]] = None) -> D
         current = running.setdefault(
             app_key,
             {
-                "pids": set(),
+                "count": 0,
                 "title": detected_title,
             },
         )
-        current["pids"].add(proc_info.get("pid"))
+        current["count"] += 1
         if detected_title:
             current["title"] = detected_title
     return running
@@ -214,6 +229,20 @@ def _format_update_interval(seconds: float) -> str:
     return f"{seconds:.1f}".rstrip("0").rstrip(".")
 
 
+@lru_cache(maxsize=64)
+def _footer_lines(active_viewer_count: int, update_interval_seconds: float) -> Tuple[str, ...]:
+    if active_viewer_count > 0:
+        viewers_line = f"👀 Сейчас наблюдают за статусом: {active_viewer_count}"
+    else:
+        viewers_line = "😴 Сейчас никто не смотрит"
+    return (
+        "",
+        FOOTER_TEXT,
+        viewers_line,
+        f"⚡ Обновление каждые {_format_update_interval(update_interval_seconds)} сек",
+    )
+
+
 def build_status_text(
     state: Dict[str, Any],
     snapshot: Optional[Dict[str, Any]],
@@ -222,6 +251,33 @@ def build_status_text(
     running_apps: Optional[Dict[str, Dict[str, Any]]] = None,
     process_list: Optional[List[Dict[str, Any]]] = None,
     plugin_manager: Optional[Any] = None,
+) -> str:
+    snapshot_ts = snapshot.get("timestamp") if snapshot else None
+    key = (int(time.time()), snapshot_ts, active_viewer_count, update_interval_seconds, id(plugin_manager))
+    if _STATUS_TEXT_CACHE["key"] == key:
+        return _STATUS_TEXT_CACHE["text"]
+    text = _render_status_text(
+        state,
+        snapshot,
+        active_viewer_count,
+        update_interval_seconds,
+        running_apps,
+        process_list,
+        plugin_manager,
+    )
+    _STATUS_TEXT_CACHE["key"] = key
+    _STATUS_TEXT_CACHE["text"] = text
+    return text
+
+
+def _render_status_text(
+    state: Dict[str, Any],
+    snapshot: Optional[Dict[str, Any]],
+    active_viewer_count: int = 0,
+    update_interval_seconds: float = 1.0,
+    running_apps: Optional[Dict[str, Dict[str, Any]]] = None,
+    process_list: Optional[List[Dict[str, Any]]] = None,
+    plugin_manager: Optional[Any] = None,
 ) -> str:
     uptime_seconds = get_bot_uptime_seconds()
     snapshot = snapshot or {}
@@ -241,8 +297,7 @@ def build_status_text(
     parts = [
         f"🖥️ Аптайм ПК (с запуска бота): {format_duration(uptime_seconds)}",
         f"⌚ Время на моём ПК: {get_local_time_string()}",
-        f"🪟 Активное приложение: {display_name}",
-        f"💬 Приписка: {tagline}",
+        *_active_app_lines(display_name, tagline),
     ]
 
     if app_uptime_seconds is not None:
@@ -253,7 +308,9 @@ def build_status_text(
     if app_key == "minecraft" and minecraft_client:
         parts.append(f"🧩 Client: {minecraft_client}")
 
-    process_count = get_process_count()
+    if process_list is None:
+        process_list = list_running_processes()
+    process_count = len(process_list) if process_list else get_process_count()
     if process_count is not None:
         parts.append(f"🔢 Процессов: {process_count}")
 
@@ -279,8 +336,6 @@ def build_status_text(
     parts.append("Избранные программы")
     parts.extend(favorite_lines)
 
-    if process_list is None:
-        process_list = list_running_processes()
     work_languages = _detect_work_languages(process_list, os.getpid())
     if work_languages:
         parts.append("")
@@ -288,13 +343,7 @@ def build_status_text(
         for lang in work_languages:
             parts.append(f"• {lang}")
 
-    parts.append("")
-    parts.append(FOOTER_TEXT)
-    if active_viewer_count > 0:
-        parts.append(f"👀 Сейчас наблюдают за статусом: {active_viewer_count}")
-    else:
-        parts.append("😴 Сейчас никто не смотрит")
-    parts.append(f"⚡ Обновление каждые {_format_update_interval(update_interval_seconds)} сек")
+    parts.extend(_footer_lines(active_viewer_count, update_interval_seconds))
 
     if plugin_manager is not None:
         from system.plugins import RenderContext
@@ -2,6 +2,7 @@ import re
 from typing import Tuple
 
 MC_VERSION_PATTERN = re.compile(r"\b(\d+\.\d+(?:\.\d+)?[a-z]?)\b")
+TRAILING_LETTERS_PATTERN = re.compile(r"[a-z]+$", re.IGNORECASE)
 CLIENT_PATTERNS: Tuple[Tuple[str, re.Pattern[str]], ...] = (
     ("Lunar Client", re.compile(r"Lunar\s+Client(?:\s+v?([0-9][\w.\-]+))?", re.IGNORECASE)),
     ("LabyMod", re.compile(r"LabyMod(?:\s+v?([0-9][\w.\-]+))?", re.IGNORECASE)),
@@ -15,3 +16,4 @@ MIN_MINECRAFT_SERVER_SECONDS = 5.0
 MIN_MINECRAFT_SERVER_TICKS = 2
 BLOCKED_PORTS = {443}
 BLOCKED_IP_PREFIXES = {13, 18, 34}
+TRACKER_FULL_SCAN_EVERY_TICKS = 5
@@ -1,15 +1,16 @@
 import asyncio
 import ipaddress
 import logging
-import re
 import socket
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import psutil
 
+from system.runtime import sleep_until_next_tick
 from system.state import ensure_app_state
-from system.status import resolve_app_key, resolve_tagline
+from system.status import JAVA_PROCESS_NAMES, resolve_app_key, resolve_tagline
 from system.platform import (
     get_active_process_info,
     get_process_uptime_seconds,
@@ -23,11 +24,15 @@ from .constants import (
     MC_VERSION_PATTERN,
     MIN_MINECRAFT_SERVER_SECONDS,
     MIN_MINECRAFT_SERVER_TICKS,
+    TRACKER_FULL_SCAN_EVERY_TICKS,
+    TRAILING_LETTERS_PATTERN,
 )
+@lru_cache(maxsize=256)
 def _normalize_version(version: str) -> str:
-    return re.sub(r"[a-z]+$", "", version, flags=re.IGNORECASE)
+    return TRAILING_LETTERS_PATTERN.sub("", version)
 
 
+@lru_cache(maxsize=256)
 def _is_valid_mc_version(version: str) -> bool:
     normalized = _normalize_version(version)
     if normalized.startswith("0."):
@@ -47,8 +52,9 @@ def _is_valid_mc_version(version: str) -> bool:
     return major > 26
 
 
+@lru_cache(maxsize=64)
 def _extract_mc_version(title: Optional[str]) -> Optional[str]:
-    if not title:
+    if not title or "." not in title:
         return None
     for match in MC_VERSION_PATTERN.finditer(title):
         candidate = match.group(1)
@@ -71,10 +77,24 @@ def _resolve_domain(host: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
+def _classify_host(host: str) -> Optional[Tuple[str, bool]]:
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return host, True
+    if _is_blocked_ip(ip):
+        return ("LAN", True) if ip.is_private or ip.is_loopback else None
+    domain = _resolve_domain(host)
+    if domain:
+        return domain, True
+    return host, False
+
+
 def _collect_java_connections(pid: int) -> List[tuple[str, int, bool]]:
     try:
         proc = psutil.Process(pid)
-        if proc.name().lower() not in {"java.exe", "javaw.exe"}:
+        if proc.name().lower() not in JAVA_PROCESS_NAMES:
             return []
         results: List[tuple[str, int, bool]] = []
         for conn in proc.connections(kind="inet"):
@@ -84,19 +104,9 @@ def _collect_java_connections(pid: int) -> List[tuple[str, int, bool]]:
             port = conn.raddr.port if hasattr(conn.raddr, "port") else conn.raddr[1]
             if not host or port in BLOCKED_PORTS:
                 continue
-            try:
-                ip = ipaddress.ip_address(host)
-                if _is_blocked_ip(ip):
-                    if ip.is_private or ip.is_loopback:
-                        results.append(("LAN", port, True))
-                    continue
-                domain = _resolve_domain(host)
-                if domain:
-                    results.append((domain, port, True))
-                else:
-                    results.append((host, port, False))
-            except ValueError:
-                results.append((host, port, True))
+            classified = _classify_host(host)
+            if classified:
+                results.append((classified[0], port, classified[1]))
         return results
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return []
@@ -188,7 +198,7 @@ def _detect_active_snapshot() -> Dict[str, Any]:
     app_key = resolve_app_key(process_name)
     minecraft_title = None
 
-    if process_name.lower() in {"java.exe", "javaw.exe"}:
+    if process_name.lower() in JAVA_PROCESS_NAMES:
         minecraft_title = _detect_minecraft_title(pid)
         if minecraft_title:
             app_key = "minecraft"
@@ -225,7 +235,7 @@ def _collect_running_apps(processes: List[Dict[str, Any]]) -> Dict[str, Dict[str
         app_key = resolve_app_key(name)
         pid = proc_info.get("pid")
         title = None
-        if name.lower() in {"java.exe", "javaw.exe"}:
+        if name.lower() in JAVA_PROCESS_NAMES:
             minecraft_title = _detect_minecraft_title(pid)
             if minecraft_title:
                 app_key = "minecraft"
@@ -240,11 +250,11 @@ def _collect_running_apps(processes: List[Dict[str, Any]]) -> Dict[str, Dict[str
         current = running.setdefault(
             app_key,
             {
-                "pids": set(),
+                "count": 0,
                 "title": title,
             },
         )
-        current["pids"].add(pid)
+        current["count"] += 1
         if title:
             current["title"] = title
     return running
@@ -273,6 +283,7 @@ def init_tracker_state(bot_data: Dict[str, Any]) -> Dict[str, Any]:
             "last_snapshot": None,
             "running_apps": {},
             "process_list": [],
+            "last_full_scan_ts": None,
             "server_candidates": {},
         },
     )
@@ -295,15 +306,13 @@ def get_snapshot_for_publish(tracker: Dict[str, Any]) -> Optional[Dict[str, Any]
     return tracker.get("last_snapshot")
 
 
-def _collect_snapshot_payload() -> Dict[str, Any]:
-    processes = list_running_processes()
-    snapshot = _detect_active_snapshot()
-    running_apps = _collect_running_apps(processes)
-    return {
-        "snapshot": snapshot,
-        "process_list": processes,
-        "running_apps": running_apps,
-    }
+def _collect_snapshot_payload(full_scan: bool = True) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"snapshot": _detect_active_snapshot()}
+    if full_scan:
+        processes = list_running_processes()
+        payload["process_list"] = processes
+        payload["running_apps"] = _collect_running_apps(processes)
+    return payload
 
 
 def _update_latest_snapshot(tracker: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
@@ -313,16 +322,22 @@ def _update_latest_snapshot(tracker: Dict[str, Any], snapshot: Dict[str, Any]) -
 async def tracker_loop(app) -> None:
     logging.info("Internal tracker started")
     tracker = init_tracker_state(app.bot_data)
+    tick = 0
+    next_tick = time.monotonic()
     while True:
         try:
-            payload = await asyncio.to_thread(_collect_snapshot_payload)
+            full_scan = tick % TRACKER_FULL_SCAN_EVERY_TICKS == 0
+            tick += 1
+            payload = await asyncio.to_thread(_collect_snapshot_payload, full_scan)
             snapshot = payload["snapshot"]
             now_ts = time.time()
             if snapshot.get("app_key") == "minecraft":
                 server = _select_persistent_server(tracker, snapshot.get("pid"), now_ts)
                 snapshot["minecraft_server"] = server
-            tracker["running_apps"] = payload["running_apps"]
-            tracker["process_list"] = payload["process_list"]
+            if full_scan:
+                tracker["running_apps"] = payload["running_apps"]
+                tracker["process_list"] = payload["process_list"]
+                tracker["last_full_scan_ts"] = now_ts
             _update_latest_snapshot(tracker, snapshot)
             plugin_manager = app.bot_data.get("plugins")
             if plugin_manager:
@@ -335,4 +350,4 @@ async def tracker_loop(app) -> None:
                 _update_app_activity(state, snapshot)
         except Exception as exc:
             logging.exception("Tracker loop error: %s", exc)
-        await asyncio.sleep(1)
+        next_tick = await sleep_until_next_tick(next_tick, 1.0, "Tracker")